@@ -0,0 +1,81 @@
+"""Gereksinim başına bellek kullanımı: sözlük vs. Requirement kaydı
+
+JSON'dan yüklenmiş gibi (tekrarlanan metinler ayrı nesneler) N gereksinim
+üretir ve tracemalloc ile iki gösterimin kapladığı belleği ölçer::
+
+    python benchmarks/bench_memory.py 100000
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from requirement_record import Requirement  # noqa: E402
+
+STATUSES = ["Draft", "In Review", "Approved", "Rejected", "Implemented"]
+LAYERS = ["Requirements", "Notes", "Background"]
+USERS = ["Kullanıcı", "Ayşe", "Mehmet"]
+
+
+def sample_project(count):
+    """Dosyadan okunan projeye benzeyen, JSON metni halinde gereksinimler"""
+    start = datetime(2024, 1, 1)
+    requirements = {}
+    for num in range(1, count + 1):
+        rtype = "ust" if num % 5 == 0 else "alt"
+        stamp = (start + timedelta(seconds=num * 37, microseconds=num)).isoformat()
+        requirements[str(num)] = {
+            "id": f"R{num}",
+            "num": num,
+            "type": rtype,
+            "pos": [(num % 200) * 180, (num // 200) * 100],
+            "text": f"Gereksinim R{num}",
+            "note": "",
+            "children": [num + 1] if rtype == "ust" else [],
+            "color": "lightgreen" if rtype == "ust" else "lightblue",
+            "layer": LAYERS[num % len(LAYERS)],
+            "status": STATUSES[num % len(STATUSES)],
+            "created_by": USERS[num % len(USERS)],
+            "created_date": stamp,
+            "modified_date": stamp,
+        }
+    return json.dumps(requirements)
+
+
+def measure(build, text):
+    gc.collect()
+    tracemalloc.start()
+    objects = build(json.loads(text))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objects, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("count", nargs="?", type=int, default=100000, help="gereksinim sayısı")
+    args = parser.parse_args()
+
+    text = sample_project(args.count)
+    dicts, dict_bytes = measure(lambda data: {int(k): v for k, v in data.items()}, text)
+    records, record_bytes = measure(
+        lambda data: {int(k): Requirement.from_dict(v) for k, v in data.items()}, text)
+
+    # Kayıtlar dosyaya birebir aynı değerlerle geri yazılmalı
+    assert all(records[num].to_dict() == dict(info, pos=tuple(info["pos"])) for num, info in dicts.items())
+
+    mb = 1024 * 1024
+    print(f"{args.count} gereksinim")
+    print(f"  dict        : {dict_bytes / mb:8.1f} MB  ({dict_bytes / args.count:6.0f} B/gereksinim)")
+    print(f"  Requirement : {record_bytes / mb:8.1f} MB  ({record_bytes / args.count:6.0f} B/gereksinim)")
+    print(f"  tasarruf    : {(1 - record_bytes / dict_bytes) * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+"""İkili (binary) proje snapshot formatı
+
+Dosya düzeni (tüm sayılar little-endian):
+
+    başlık      MAGIC, sürüm (H), bölüm sayısı (H)
+    dizin       her bölüm için: ad (8s), ofset (Q), uzunluk (Q), kayıt sayısı (I)
+    bölümler    STRTAB/STRIDX  tekilleştirilmiş UTF-8 string tablosu + (ofset, uzunluk) indeksi
+                REQS/GROUPS/TEXTS  sabit genişlikli obje kayıtları
+                CHILDREN  gereksinimlerin "children" listeleri (I dizisi)
+                LINKS     (parent, child) çiftleri
+                META/COMMENTS/REVIEWS/HISTORY  sıkıştırılmamış JSON
+
+Pozisyon ve boyutlar double, metin alanları string tablosu indeksi olarak
+tutulur. Dosya ``mmap`` ile açıldığı için canvas'a geometri yüklenirken not
+gövdeleri gibi uzun metinler hiç çözülmez; string'ler istendiğinde dilimlenir.
+Kayıtlara sığmayan alanlar objenin "extra" JSON string'inde saklanır, böylece
+JSON formatına birebir geri dönüştürülebilir.
+"""
+import functools
+import json
+import math
+import mmap
+import struct
+
+from project_storage import STREAM_SECTIONS, ProjectJournal, ProjectStream, assemble_project, write_atomic
+
+MAGIC = b"RQBSNAP\0"
+VERSION = 1
+BINARY_SUFFIX = ".rqb"
+
+NO_STRING = 0xFFFFFFFF
+
+HEADER = struct.Struct("<8sHH")
+DIRECTORY_ENTRY = struct.Struct("<8sQQI")
+STRING_ENTRY = struct.Struct("<II")
+LINK_ENTRY = struct.Struct("<II")
+CHILD_ENTRY = struct.Struct("<I")
+
+# Kayıt bayrakları
+FLAG_KEY_FIELD = 1      # obje kendi anahtarını (num/id) da taşıyor
+FLAG_SIZE = 2           # "size" alanı var
+FLAG_INT_GEOMETRY = 4   # pozisyon/boyut tamsayıydı
+FLAG_CHILDREN = 8       # "children" listesi var
+
+# bölüm: (dosyadaki ad, anahtar alanı, string alanları)
+OBJECT_SECTIONS = {
+    "requirements": (b"REQS", "num", ("id", "type", "text", "note", "color", "layer", "status",
+                                      "created_by", "created_date", "modified_date")),
+    "groups": (b"GROUPS", "id", ("name", "color", "layer")),
+    "text_boxes": (b"TEXTS", "id", ("content", "layer")),
+}
+
+# Tekrar eden kısa değerler; okurken tek string objesi paylaşılır
+INTERNED_FIELDS = {"type", "color", "layer", "status", "created_by"}
+
+JSON_SECTIONS = {"comments": b"COMMENTS", "reviews": b"REVIEWS", "history": b"HISTORY"}
+
+
+def _record_struct(string_fields):
+    # anahtar, bayraklar, x, y, w, h, string alanları, children başı/sayısı, extra
+    return struct.Struct("<IBdddd" + "I" * len(string_fields) + "III")
+
+
+RECORD_STRUCTS = {section: _record_struct(fields) for section, (_, _, fields) in OBJECT_SECTIONS.items()}
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class _StringTable:
+    def __init__(self):
+        self.index = {}
+        self.entries = bytearray()
+        self.blob = bytearray()
+
+    def add(self, value):
+        if value is None:
+            return NO_STRING
+        i = self.index.get(value)
+        if i is None:
+            data = value.encode("utf-8")
+            i = self.index[value] = len(self.index)
+            self.entries += STRING_ENTRY.pack(len(self.blob), len(data))
+            self.blob += data
+        return i
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _encode_objects(section, objects, strings, children):
+    name, key_field, string_fields = OBJECT_SECTIONS[section]
+    record = RECORD_STRUCTS[section]
+    out = bytearray()
+    for key, info in objects.items():
+        key = int(key)
+        extra = dict(info)
+        flags = 0
+        if extra.get(key_field) == key and _is_int(extra.get(key_field)):
+            flags |= FLAG_KEY_FIELD
+            del extra[key_field]
+
+        x, y = extra.pop("pos")
+        w = h = math.nan
+        geometry = [x, y]
+        if "size" in extra:
+            w, h = extra.pop("size")
+            geometry += [w, h]
+            flags |= FLAG_SIZE
+        if all(_is_int(v) for v in geometry):
+            flags |= FLAG_INT_GEOMETRY
+
+        fields = []
+        for field in string_fields:
+            value = extra.get(field)
+            if isinstance(value, str):
+                del extra[field]
+                fields.append(strings.add(value))
+            else:
+                # Eksik ya da string olmayan değer extra'da kalır
+                fields.append(NO_STRING)
+
+        child_start = len(children) // CHILD_ENTRY.size
+        child_count = 0
+        value = extra.get("children")
+        if isinstance(value, list) and all(_is_int(c) and c >= 0 for c in value):
+            del extra["children"]
+            flags |= FLAG_CHILDREN
+            for child in value:
+                children += CHILD_ENTRY.pack(child)
+            child_count = len(value)
+
+        extra_index = strings.add(_dumps(extra).decode("utf-8")) if extra else NO_STRING
+        out += record.pack(key, flags, x, y, w, h, *fields, child_start, child_count, extra_index)
+    return name, bytes(out), len(objects)
+
+
+def write_binary_snapshot(path, data):
+    """JSON formatındaki proje sözlüğünü ikili snapshot olarak atomik yaz"""
+    strings = _StringTable()
+    children = bytearray()
+    sections = []
+    for section in OBJECT_SECTIONS:
+        sections.append(_encode_objects(section, data.get(section, {}), strings, children))
+    sections.append((b"CHILDREN", bytes(children), len(children) // CHILD_ENTRY.size))
+
+    links = bytearray()
+    for parent, childs in data.get("links", {}).items():
+        for child in childs:
+            links += LINK_ENTRY.pack(int(parent), child)
+    sections.append((b"LINKS", bytes(links), len(links) // LINK_ENTRY.size))
+
+    for section, name in JSON_SECTIONS.items():
+        value = data.get(section, [] if section == "history" else {})
+        sections.append((name, _dumps(value), len(value)))
+    meta = {k: v for k, v in data.items() if k not in STREAM_SECTIONS}
+    sections.append((b"META", _dumps(meta), len(meta)))
+    sections.append((b"STRIDX", bytes(strings.entries), len(strings.index)))
+    sections.append((b"STRTAB", bytes(strings.blob), len(strings.index)))
+
+    offset = HEADER.size + DIRECTORY_ENTRY.size * len(sections)
+    directory = []
+    for name, blob, count in sections:
+        directory.append(DIRECTORY_ENTRY.pack(name, offset, len(blob), count))
+        offset += len(blob)
+
+    def write(f):
+        f.write(HEADER.pack(MAGIC, VERSION, len(sections)))
+        f.writelines(directory)
+        f.writelines(blob for _, blob, _ in sections)
+
+    write_atomic(path, write, binary=True)
+
+
+class BinarySnapshot:
+    """``mmap`` ile açılan ikili snapshot; bölümler ve string'ler istendikçe çözülür"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: ikili proje dosyası değil")
+        if version > VERSION:
+            self.close()
+            raise ValueError(f"{path}: desteklenmeyen dosya sürümü ({version})")
+
+        self.sections = {}
+        for i in range(count):
+            name, offset, length, records = DIRECTORY_ENTRY.unpack_from(self.map, HEADER.size + i * DIRECTORY_ENTRY.size)
+            self.sections[name.rstrip(b"\0")] = (offset, length, records)
+        self._interned = {}
+
+    def close(self):
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _entries(self, name, entry):
+        """Bölümdeki sabit genişlikli kayıtlar; mmap üzerinden kopyalamadan okunur"""
+        offset, length, _ = self.sections.get(name, (0, 0, 0))
+        for position in range(offset, offset + length, entry.size):
+            yield entry.unpack_from(self.map, position)
+
+    def _bytes(self, name):
+        offset, length, _ = self.sections.get(name, (0, 0, 0))
+        return self.map[offset:offset + length]
+
+    def count(self, section):
+        """Bölümdeki obje sayısı (çözmeden)"""
+        return self.sections.get(OBJECT_SECTIONS[section][0], (0, 0, 0))[2]
+
+    def string(self, index):
+        if index == NO_STRING:
+            return None
+        offset, length = STRING_ENTRY.unpack_from(self.map, self.sections[b"STRIDX"][0] + index * STRING_ENTRY.size)
+        start = self.sections[b"STRTAB"][0] + offset
+        return self.map[start:start + length].decode("utf-8")
+
+    def _interned_string(self, index):
+        value = self._interned.get(index)
+        if value is None and index != NO_STRING:
+            value = self._interned[index] = self.string(index)
+        return value
+
+    def _records(self, section):
+        return self._entries(OBJECT_SECTIONS[section][0], RECORD_STRUCTS[section])
+
+    def geometry(self, section):
+        """(anahtar, x, y, w, h, katman) - sadece canvas yerleşimi için, metinler çözülmez"""
+        layer_slot = 6 + OBJECT_SECTIONS[section][2].index("layer")
+        for values in self._records(section):
+            key, flags, x, y, w, h = values[:6]
+            if not flags & FLAG_SIZE:
+                w = h = None
+            yield key, x, y, w, h, self._interned_string(values[layer_slot])
+
+    def objects(self, section):
+        """(anahtar, obje sözlüğü) çiftleri, JSON formatındaki alanlarla"""
+        _, key_field, string_fields = OBJECT_SECTIONS[section]
+        children_offset = self.sections.get(b"CHILDREN", (0, 0, 0))[0]
+        for values in self._records(section):
+            key, flags, x, y, w, h = values[:6]
+            child_start, child_count, extra_index = values[-3:]
+            info = {}
+            if flags & FLAG_KEY_FIELD:
+                info[key_field] = key
+            if flags & FLAG_INT_GEOMETRY:
+                x, y, w, h = int(x), int(y), (int(w) if flags & FLAG_SIZE else w), (int(h) if flags & FLAG_SIZE else h)
+            info["pos"] = [x, y]
+            if flags & FLAG_SIZE:
+                info["size"] = [w, h]
+            for field, index in zip(string_fields, values[6:-3]):
+                if index != NO_STRING:
+                    info[field] = self._interned_string(index) if field in INTERNED_FIELDS else self.string(index)
+            if flags & FLAG_CHILDREN:
+                start = children_offset + child_start * CHILD_ENTRY.size
+                info["children"] = list(struct.unpack_from(f"<{child_count}I", self.map, start))
+            if extra_index != NO_STRING:
+                info.update(json.loads(self.string(extra_index)))
+            yield str(key), info
+
+    def links(self):
+        links = {}
+        for parent, child in self._entries(b"LINKS", LINK_ENTRY):
+            links.setdefault(str(parent), []).append(child)
+        return links
+
+    def json_section(self, name):
+        blob = self._bytes(name)
+        return json.loads(blob.decode("utf-8")) if blob else None
+
+    def stream(self, skip_sections=()):
+        """Projeyi akışlı yükleyicinin beklediği (bölüm, anahtar, değer) akışı olarak ver
+
+        Meta ve yorum/review'lar objelerden önce gelir; sıralama JSON
+        snapshot'larıyla aynıdır. ``skip_sections`` içindeki JSON bölümleri
+        hiç çözülmez.
+        """
+        total = sum(self.count(section) for section in OBJECT_SECTIONS) + 1
+        done = [0]
+
+        def items():
+            try:
+                for key, value in self.json_section(b"META").items():
+                    yield key, None, value
+                for section in ("comments", "reviews"):
+                    if section not in skip_sections:
+                        yield from self._json_members(section)
+                for section in ("groups", "requirements"):
+                    yield from self._object_members(section, done)
+                links = self.links()
+                if not links:
+                    yield "links", None, {}
+                for key, value in links.items():
+                    yield "links", key, value
+                yield from self._object_members("text_boxes", done)
+                if "history" not in skip_sections:
+                    yield from self._json_members("history")
+                done[0] += 1
+            finally:
+                self.close()
+
+        loaders = {section: functools.partial(read_binary_section, self.path, section) for section in skip_sections}
+        return ProjectStream(items(), lambda: done[0] / total, loaders)
+
+    def _object_members(self, section, done):
+        empty = True
+        for key, info in self.objects(section):
+            empty = False
+            done[0] += 1
+            yield section, key, info
+        if empty:
+            yield section, None, {}
+
+    def _json_members(self, section):
+        value = self.json_section(JSON_SECTIONS[section])
+        if not value:
+            yield section, None, value if value is not None else ([] if section == "history" else {})
+            return
+        members = value.items() if isinstance(value, dict) else enumerate(value)
+        for key, member in members:
+            yield section, key, member
+
+
+def read_binary_snapshot(path):
+    """İkili snapshot'ı JSON formatıyla aynı yapıda bir sözlüğe oku"""
+    data = assemble_project(BinarySnapshot(path).stream())
+    data.pop("journal_seq", None)
+    return data
+
+
+def open_binary_stream(path, skip_sections=()):
+    return BinarySnapshot(path).stream(skip_sections)
+
+
+def read_binary_section(path, section):
+    """Tek bir JSON bölümünü (yorumlar, review'lar, geçmiş) oku"""
+    with BinarySnapshot(path) as snapshot:
+        return snapshot.json_section(JSON_SECTIONS[section])
+
+
+def binary_journal(path):
+    """İkili snapshot + aynı günlük formatı (artımlı ve otomatik kayıtlar için)"""
+    return ProjectJournal(path, reader=open_binary_stream, writer=write_binary_snapshot)
+
+
+def json_to_binary(json_path, binary_path):
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    data.pop("journal_seq", None)
+    data.pop("tail_sections", None)
+    write_binary_snapshot(binary_path, data)
+
+
+def binary_to_json(binary_path, json_path, indent=2):
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(read_binary_snapshot(binary_path), f, ensure_ascii=False, indent=indent)
@@ -0,0 +1,181 @@
+"""Kilitli katmanların bitmap karolarına çizilmesi
+
+Dondurulan bir katmanın objeleri canvas item'ı olarak değil, modelden
+ekransız çizilen karolar halinde gösterilir. Karolar 2'nin kuvveti olan
+çözünürlük seviyelerinde çizilir ve saklanır; aradaki zoom'larda sadece
+küçültülür. Seviye değişince, katmanın kilidi açılınca veya bir obje
+değişince ilgili karolar yeniden çizilir.
+
+Pillow yoksa ``RASTER_AVAILABLE`` False olur ve katmanlar dondurulmaz.
+"""
+import math
+
+try:
+    from PIL import Image, ImageDraw, ImageFont, ImageColor, ImageTk
+    RASTER_AVAILABLE = True
+except ImportError:
+    RASTER_AVAILABLE = False
+
+from requirement_store import REQUIREMENT_SIZE
+
+TILE_SIZE = 256
+# Bellekte tutulan en fazla karo (katman başına)
+TILE_CACHE_LIMIT = 128
+
+
+def resolution_level(zoom):
+    """Zoom'un karo çözünürlüğü: zoom'a eşit veya büyük en küçük 2'nin kuvveti"""
+    return 2.0 ** math.ceil(math.log2(zoom) - 1e-9)
+
+
+def _rgb(color, default):
+    try:
+        return ImageColor.getrgb(color)
+    except (ValueError, AttributeError):
+        # Tk'ya özel renk adları
+        return ImageColor.getrgb(default)
+
+
+def _font(points, bold=False):
+    # Canvas yazıları zoom'la büyümez; karo, seviyesine eşit zoom'da birebir gösterilir
+    size = round(points * 4 / 3)
+    try:
+        return ImageFont.truetype("arialbd.ttf" if bold else "arial.ttf", size)
+    except OSError:
+        try:
+            return ImageFont.load_default(size)
+        except TypeError:
+            # Pillow < 10.1
+            return ImageFont.load_default()
+
+
+class LayerRaster:
+    """Bir katmanın ``level`` çözünürlüğünde çizilmiş karoları
+
+    (i, j) karosu dünya koordinatlarında ``TILE_SIZE / level`` kenarlı
+    kareyi kaplar. ``labels`` False ise kutular yazısız, ``requirements``
+    False ise gereksinimler hiç çizilmez (özet görünüm).
+    """
+
+    def __init__(self, store, layer, level, status_colors, labels=True, requirements=True):
+        self.store = store
+        self.layer = layer
+        self.level = level
+        self.status_colors = status_colors
+        self.labels = labels
+        self.requirements = requirements
+        self.tiles = {}   # (i, j) -> PIL görüntüsü; boş karolar None
+        self.fonts = {}
+
+    def matches(self, level, labels, requirements):
+        return (self.level, self.labels, self.requirements) == (level, labels, requirements)
+
+    def tile_span(self):
+        """Bir karonun dünya birimindeki kenarı"""
+        return TILE_SIZE / self.level
+
+    def tiles_in(self, x0, y0, x1, y1):
+        span = self.tile_span()
+        return [(i, j)
+                for i in range(math.floor(x0 / span), math.floor(x1 / span) + 1)
+                for j in range(math.floor(y0 / span), math.floor(y1 / span) + 1)]
+
+    def tile(self, i, j):
+        """Karonun görüntüsü (gerekirse çizilir); katmanın orada objesi yoksa None"""
+        key = (i, j)
+        if key in self.tiles:
+            # Son kullanılan sona taşınır; sınır aşılınca en eskisi atılır
+            image = self.tiles[key] = self.tiles.pop(key)
+            return image
+        image = self.tiles[key] = self.render(i, j)
+        if len(self.tiles) > TILE_CACHE_LIMIT:
+            del self.tiles[next(iter(self.tiles))]
+        return image
+
+    def tile_photo(self, i, j, zoom):
+        """Karonun ``zoom``'daki canvas konumu ve Tk görüntüsü (x, y, photo); boş karoda None"""
+        image = self.tile(i, j)
+        if image is None:
+            return None
+        # Komşu karolar arasında boşluk kalmaması için kenarlar ayrı ayrı yuvarlanır
+        scale = TILE_SIZE * zoom / self.level
+        x0, y0 = round(i * scale), round(j * scale)
+        size = (round((i + 1) * scale) - x0, round((j + 1) * scale) - y0)
+        if size != image.size:
+            image = image.resize(size, Image.BILINEAR)
+        return x0, y0, ImageTk.PhotoImage(image)
+
+    def invalidate(self, bounds):
+        """Sınırlarla kesişen karoları unut; etkilenen karo anahtarlarını döndür"""
+        keys = self.tiles_in(*bounds)
+        for key in keys:
+            self.tiles.pop(key, None)
+        return keys
+
+    # --- Çizim ---
+    def font(self, points, bold=False):
+        key = (points, bold)
+        if key not in self.fonts:
+            self.fonts[key] = _font(points, bold)
+        return self.fonts[key]
+
+    def render(self, i, j):
+        span = self.tile_span()
+        wx0, wy0 = i * span, j * span
+        objects = []
+        # Canvas'taki gibi gruplar altta, gereksinimler üstte
+        sections = ("groups", "text_boxes", "requirements") if self.requirements else ("groups", "text_boxes")
+        for section in sections:
+            for key in self.store.objects_in(section, wx0, wy0, wx0 + span, wy0 + span, visible_only=False):
+                if self.store.object_layer(section, key) == self.layer:
+                    objects.append((section, key))
+        if not objects:
+            return None
+
+        image = Image.new("RGBA", (TILE_SIZE, TILE_SIZE), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        s = self.level
+
+        def point(x, y):
+            return (x - wx0) * s, (y - wy0) * s
+
+        for section, key in objects:
+            info = getattr(self.store, section)[key]
+            x, y = point(*info["pos"])
+            if section == "requirements":
+                self.draw_requirement(draw, info, x, y, s)
+            elif section == "groups":
+                self.draw_group(draw, info, x, y, s)
+            else:
+                self.draw_text_box(draw, info, x, y, s)
+        return image
+
+    def text(self, draw, xy, text, font, fill="black", anchor="mm"):
+        draw.text(xy, str(text), fill=fill, font=font, anchor=anchor)
+
+    def draw_requirement(self, draw, info, x, y, s):
+        w, h = REQUIREMENT_SIZE[0] * s, REQUIREMENT_SIZE[1] * s
+        status = info.get("status", "Draft")
+        color = self.status_colors.get(status) or info.get("color", "lightgreen" if info["type"] == "ust" else "lightblue")
+        draw.rectangle((x, y, x + w, y + h), fill=_rgb(color, "lightgreen"), outline="black", width=1)
+        if not self.labels:
+            return
+        # Yorum/review göstergeleri bitmap'te yer almaz
+        self.text(draw, (x + 80*s, y + 10*s), info["text"], self.font(9, bold=True))
+        self.text(draw, (x + 80*s, y + 25*s), f"ID: {info['id']}", self.font(8))
+        self.text(draw, (x + 80*s, y + 40*s), f"Status: {status}", self.font(7))
+        self.text(draw, (x + 80*s, y + 55*s), f"Alt: {info['children']}", self.font(7))
+
+    def draw_group(self, draw, info, x, y, s):
+        w, h = info["size"][0] * s, info["size"][1] * s
+        draw.rectangle((x, y, x + w, y + h), fill=_rgb(info["color"], "lightyellow"), outline="gray", width=2)
+        draw.rectangle((x + w - 10*s, y + h - 10*s, x + w, y + h), fill="gray", outline="darkgray")
+        if self.labels:
+            self.text(draw, (x + 10*s, y + 10*s), info["name"], self.font(10, bold=True), anchor="la")
+
+    def draw_text_box(self, draw, info, x, y, s):
+        w, h = info["size"][0] * s, info["size"][1] * s
+        draw.rectangle((x, y, x + w, y + h), fill="white", outline="lightgray", width=1)
+        draw.rectangle((x + w - 8*s, y + h - 8*s, x + w, y + h), fill="lightgray", outline="gray")
+        if self.labels:
+            self.text(draw, (x + 5*s, y + h / 2), info["content"], self.font(info["font_size"]), anchor="lm")
@@ -0,0 +1,264 @@
+"""Sıkıştırılmış, bölümlere ayrılmış proje arşivi
+
+Ağ paylaşımlarında tutulan ve kopyalanan büyük projeler için. Dosya düzeni
+(tüm sayılar little-endian):
+
+    başlık      MAGIC, sürüm (H), bölüm sayısı (H)
+    dizin       her bölüm için: ad (8s), ofset (Q), sıkıştırılmış uzunluk (Q),
+                açık uzunluk (Q), CRC32 (I)
+    bölümler    zlib ile ayrı ayrı sıkıştırılmış JSON:
+                META      meta anahtarları ve gösterge özeti
+                GEOMETRY  objelerin metin dışındaki alanları + bağlantılar
+                TEXT      başlıklar, notlar, grup adları, text box içerikleri
+                COMMENTS/REVIEWS/HISTORY
+
+CRC32 sıkıştırılmış bayt üzerinden hesaplanır; bozuk bir bölüm açılmadan
+fark edilir. Çizim için gereken bölümler ayrı thread'lerde paralel açılır,
+yorum/review/geçmiş sadece istendiğinde açılır. Bu bölümlerden biri bozuksa
+diyagram yine açılır, bölüm boş kabul edilir ve ``warnings`` listesine yazılır.
+"""
+import functools
+import json
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from project_storage import STREAM_SECTIONS, ProjectJournal, ProjectStream, assemble_project, write_atomic
+
+MAGIC = b"RQARCH\0\0"
+VERSION = 1
+ARCHIVE_SUFFIX = ".rqa"
+
+HEADER = struct.Struct("<8sHH")
+DIRECTORY_ENTRY = struct.Struct("<8sQQQI")
+
+# Metin alanları TEXT bölümünde, geri kalanı GEOMETRY bölümünde tutulur
+TEXT_FIELDS = {
+    "requirements": ("text", "note"),
+    "groups": ("name",),
+    "text_boxes": ("content",),
+}
+
+COLLAB_SECTIONS = {"comments": b"COMMENTS", "reviews": b"REVIEWS", "history": b"HISTORY"}
+
+
+class ArchiveError(ValueError):
+    """Bölüm bozuk ya da okunamıyor"""
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _split_objects(data):
+    """Obje bölümlerini (geometri, metin) sözlüklerine ayır"""
+    geometry, text = {}, {}
+    for section, fields in TEXT_FIELDS.items():
+        geometry[section], text[section] = {}, {}
+        for key, info in data.get(section, {}).items():
+            geometry[section][key] = {k: v for k, v in info.items() if k not in fields}
+            texts = {k: info[k] for k in fields if k in info}
+            if texts:
+                text[section][key] = texts
+    geometry["links"] = data.get("links", {})
+    return geometry, text
+
+
+def write_project_archive(path, data):
+    """JSON formatındaki proje sözlüğünü arşiv olarak atomik yaz"""
+    geometry, text = _split_objects(data)
+    blobs = [(b"META", _dumps({k: v for k, v in data.items() if k not in STREAM_SECTIONS})),
+             (b"GEOMETRY", _dumps(geometry)),
+             (b"TEXT", _dumps(text))]
+    for section, name in COLLAB_SECTIONS.items():
+        blobs.append((name, _dumps(data.get(section, [] if section == "history" else {}))))
+
+    # zlib sıkıştırırken GIL'i bırakır; bölümler paralel sıkıştırılır
+    with ThreadPoolExecutor(max_workers=len(blobs)) as pool:
+        compressed = list(pool.map(zlib.compress, [raw for _, raw in blobs]))
+
+    offset = HEADER.size + DIRECTORY_ENTRY.size * len(blobs)
+    directory = []
+    for (name, raw), packed in zip(blobs, compressed):
+        directory.append(DIRECTORY_ENTRY.pack(name, offset, len(packed), len(raw), zlib.crc32(packed)))
+        offset += len(packed)
+
+    def write(f):
+        f.write(HEADER.pack(MAGIC, VERSION, len(blobs)))
+        f.writelines(directory)
+        f.writelines(compressed)
+
+    write_atomic(path, write, binary=True)
+
+
+class ProjectArchive:
+    """Arşiv dosyası; açılışta sadece dizin okunur, bölümler istendikçe açılır"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"{path}: arşiv dosyası değil")
+            magic, version, count = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"{path}: arşiv dosyası değil")
+            if version > VERSION:
+                raise ValueError(f"{path}: desteklenmeyen dosya sürümü ({version})")
+            directory = f.read(DIRECTORY_ENTRY.size * count)
+        if len(directory) < DIRECTORY_ENTRY.size * count:
+            raise ValueError(f"{path}: arşiv dizini eksik")
+
+        self.sections = {}
+        for i in range(count):
+            name, offset, length, raw_length, crc = DIRECTORY_ENTRY.unpack_from(directory, i * DIRECTORY_ENTRY.size)
+            self.sections[name.rstrip(b"\0")] = (offset, length, raw_length, crc)
+        self.warnings = []
+        self.damaged = set()
+
+    def _packed(self, name):
+        """Bölümün sıkıştırılmış baytları; sağlama toplamı tutmazsa ArchiveError"""
+        offset, length, _, crc = self.sections[name]
+        # Her çağrı kendi dosya nesnesini açar; thread'ler birbirini beklemez
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            packed = f.read(length)
+        if len(packed) != length or zlib.crc32(packed) != crc:
+            raise ArchiveError(f"{self.path}: {name.decode()} bölümünün sağlama toplamı tutmuyor")
+        return packed
+
+    def verify(self, name):
+        """Bölümü açmadan sağlama toplamını kontrol et"""
+        try:
+            self._packed(name)
+        except (ArchiveError, OSError):
+            return False
+        return True
+
+    def section(self, name):
+        """Bölümü aç ve JSON olarak çöz; bölüm yoksa None"""
+        if name not in self.sections:
+            return None
+        packed = self._packed(name)
+        try:
+            raw = zlib.decompress(packed)
+            if len(raw) != self.sections[name][2]:
+                raise ArchiveError(f"{self.path}: {name.decode()} bölümünün uzunluğu tutmuyor")
+            return json.loads(raw.decode("utf-8"))
+        except (zlib.error, UnicodeDecodeError, ValueError) as e:
+            raise ArchiveError(f"{self.path}: {name.decode()} bölümü açılamadı ({e})") from None
+
+    def collab_section(self, section):
+        """Yorum/review/geçmiş bölümü; bozuksa boş döner ve uyarı bırakır"""
+        try:
+            value = self.section(COLLAB_SECTIONS[section])
+        except (ArchiveError, OSError) as e:
+            self._warn(section, e)
+            value = None
+        if value is None:
+            value = [] if section == "history" else {}
+        return value
+
+    def _warn(self, section, error):
+        if section not in self.damaged:
+            self.damaged.add(section)
+            self.warnings.append(f"'{section}' bölümü okunamadı, boş olarak açıldı: {error}")
+
+    def stream(self, skip_sections=()):
+        """Projeyi akışlı yükleyicinin beklediği (bölüm, anahtar, değer) akışı olarak ver
+
+        Meta, geometri ve metin bölümleri hemen paralel açılmaya başlar;
+        ``skip_sections`` içindeki bölümlerin sadece sağlama toplamı arka
+        planda kontrol edilir, açılmaları ``lazy`` fonksiyonlarına kalır.
+        """
+        skipped = [section for section in COLLAB_SECTIONS if section in skip_sections]
+        pool = ThreadPoolExecutor(max_workers=len(self.sections) or 1)
+        futures = {name: pool.submit(self.section, name) for name in (b"META", b"GEOMETRY", b"TEXT")}
+        for section in COLLAB_SECTIONS:
+            if section not in skipped:
+                futures[section] = pool.submit(self.collab_section, section)
+        checks = {section: pool.submit(self.verify, COLLAB_SECTIONS[section])
+                  for section in skipped if COLLAB_SECTIONS[section] in self.sections}
+        pool.shutdown(wait=False)
+        done = [0]
+
+        def items():
+            try:
+                meta = futures[b"META"].result() or {}
+                for key, value in meta.items():
+                    yield key, None, value
+                done[0] += 1
+                for section in ("comments", "reviews"):
+                    if section not in skipped:
+                        yield from self._members(section, futures[section].result())
+                geometry = futures[b"GEOMETRY"].result() or {}
+                text = futures[b"TEXT"].result() or {}
+                done[0] += 2
+                for section in ("groups", "requirements"):
+                    yield from self._objects(section, geometry, text)
+                yield from self._members("links", geometry.get("links", {}))
+                yield from self._objects("text_boxes", geometry, text)
+                if "history" not in skipped:
+                    yield from self._members("history", futures["history"].result())
+            finally:
+                for future in futures.values():
+                    future.cancel()
+            # Atlanan bölümlerin bozuk olduğu yükleme bitmeden bildirilsin
+            for section, check in checks.items():
+                if not check.result():
+                    self._warn(section, f"{self.path}: sağlama toplamı tutmuyor")
+            done[0] += 1
+
+        loaders = {section: functools.partial(self.collab_section, section) for section in skipped}
+        stream = ProjectStream(items(), lambda: done[0] / 4, loaders)
+        stream.warnings = self.warnings
+        return stream
+
+    @staticmethod
+    def _members(section, value):
+        if not value:
+            yield section, None, value if value is not None else ([] if section == "history" else {})
+            return
+        members = value.items() if isinstance(value, dict) else enumerate(value)
+        for key, member in members:
+            yield section, key, member
+
+    @staticmethod
+    def _objects(section, geometry, text):
+        objects = geometry.get(section, {})
+        if not objects:
+            yield section, None, {}
+            return
+        texts = text.get(section, {})
+        for key, info in objects.items():
+            info.update(texts.get(key, ()))
+            yield section, key, info
+
+
+def read_project_archive(path):
+    """Arşivi JSON formatıyla aynı yapıda bir sözlüğe oku"""
+    data = assemble_project(ProjectArchive(path).stream())
+    data.pop("journal_seq", None)
+    return data
+
+
+def open_archive_stream(path, skip_sections=()):
+    return ProjectArchive(path).stream(skip_sections)
+
+
+def archive_journal(path):
+    """Arşiv snapshot + aynı günlük formatı (artımlı ve otomatik kayıtlar için)"""
+    return ProjectJournal(path, reader=open_archive_stream, writer=write_project_archive)
+
+
+def json_to_archive(json_path, archive_path):
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    data.pop("journal_seq", None)
+    data.pop("tail_sections", None)
+    write_project_archive(archive_path, data)
+
+
+def archive_to_json(archive_path, json_path, indent=2):
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(read_project_archive(archive_path), f, ensure_ascii=False, indent=indent)
@@ -0,0 +1,634 @@
+"""Proje dosyası kayıt/yükleme yardımcıları (Tkinter'dan bağımsız)"""
+import codecs
+import functools
+import itertools
+import json
+import os
+import queue
+import tempfile
+import threading
+
+PROJECT_FILE = "requirements.json"
+JOURNAL_SUFFIX = ".journal"
+HISTORY_LIMIT = 1000
+
+# Elemanları tek tek okunan büyük bölümler
+STREAM_SECTIONS = ("requirements", "links", "groups", "text_boxes", "comments", "reviews", "history")
+
+# Çizim için gerekmeyen, ilk ihtiyaçta okunabilen işbirliği bölümleri
+LAZY_SECTIONS = ("comments", "reviews", "history")
+
+# JSON snapshot'ta dosyanın sonuna yazılan bölümler (küçükten büyüğe)
+TAIL_SECTIONS = ("history", "reviews", "comments")
+
+# Günlükte silinmiş / hiç geçmeyen anahtarları işaretler
+_DELETED = object()
+_MISSING = object()
+
+# Dosyaya yazılmayan canvas item alanları
+CANVAS_KEYS = {
+    "requirements": ("rect", "text_id", "id_text_id", "status_text_id", "child_text_id"),
+    "groups": ("rect", "title", "resize_handle"),
+    "text_boxes": ("rect", "text", "resize_handle"),
+}
+
+
+def strip_canvas_keys(section, info):
+    """Objenin canvas id'leri olmadan, listeleri kopyalanmış kopyasını döndür"""
+    keys = CANVAS_KEYS.get(section, ())
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in info.items() if k not in keys}
+
+
+def strip_layer(layer_data):
+    """Katmanın türetilmiş obje listesi olmadan kopyası"""
+    return {k: v for k, v in layer_data.items() if k != "objects"}
+
+
+def copy_value(section, value):
+    """Bölümdeki tek bir değerin canlı modelden bağımsız kopyası"""
+    if section in CANVAS_KEYS:
+        return strip_canvas_keys(section, value)
+    if section == "links":
+        return list(value)
+    if section == "comments":
+        return [dict(c) for c in value]
+    if section == "reviews":
+        return dict(value)
+    return value
+
+
+def snapshot_project(data):
+    """Ana thread'de alınan, canlı modelden bağımsız proje kopyası
+
+    Worker thread serileştirirken kullanıcı düzenlemeye devam edebilsin diye
+    değişebilen her liste/sözlük kopyalanır; değişmeyen değerler paylaşılır.
+    """
+    snapshot = dict(data)
+    for section in ("requirements", "groups", "text_boxes", "links", "comments", "reviews"):
+        if section in snapshot:
+            snapshot[section] = {k: copy_value(section, v) for k, v in snapshot[section].items()}
+    if "history" in snapshot:
+        snapshot["history"] = list(snapshot["history"])
+    if "layers" in snapshot:
+        snapshot["layers"] = {name: dict(layer, objects=list(layer.get("objects", [])))
+                              for name, layer in snapshot["layers"].items()}
+    return snapshot
+
+
+def _file_mode(path):
+    """Hedef dosyanın izinleri; dosya yoksa umask'e göre varsayılan izinler"""
+    try:
+        return os.stat(path).st_mode & 0o777
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_atomic(path, write, binary=False):
+    """``write(f)`` ile geçici dosyaya yaz, fsync et ve hedefin üzerine taşı
+
+    Yazma yarıda kalırsa eski dosya olduğu gibi kalır.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") if binary else os.fdopen(fd, "w", encoding="utf-8") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp dosyayı 0600 ile açar; normal open() ile aynı izinler kalsın
+        os.chmod(tmp_path, _file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_json_atomic(path, data, indent=2):
+    """JSON'u atomik olarak yaz"""
+    write_atomic(path, lambda f: json.dump(data, f, ensure_ascii=False, indent=indent))
+
+
+def write_json_snapshot(path, data, indent=2):
+    """Proje snapshot'ını JSON olarak atomik yaz
+
+    Yorumlar, review'lar ve geçmiş dosyanın sonuna yazılır ve hemen önlerine
+    ``tail_sections`` anahtarı konur; ertelenmiş okuma bu noktaya gelince
+    dosyanın geri kalanını hiç okumaz.
+    """
+    tail = [section for section in TAIL_SECTIONS if section in data]
+    ordered = {k: v for k, v in data.items() if k not in tail and k != "tail_sections"}
+    ordered["tail_sections"] = tail
+    ordered.update((section, data[section]) for section in tail)
+    write_json_atomic(path, ordered, indent)
+
+
+def meta_values(meta):
+    """Meta kaydındaki değerler; katman obje listeleri yüklemeden sonra yeniden oluşturulur"""
+    values = dict(meta)
+    if "layers" in values:
+        values["layers"] = {name: dict(layer, objects=[]) for name, layer in values["layers"].items()}
+    return values
+
+
+def apply_record(data, record):
+    """Tek bir günlük kaydını proje sözlüğüne uygula"""
+    op = record["op"]
+    if op == "put":
+        data.setdefault(record["section"], {})[record["key"]] = record["value"]
+    elif op == "del":
+        data.get(record["section"], {}).pop(record["key"], None)
+    elif op == "append":
+        data.setdefault(record["section"], []).append(record["value"])
+    elif op == "meta":
+        data.update(meta_values(record["value"]))
+
+
+def collaboration_indicators(comments, reviews):
+    """Canvas göstergeleri için obje başına yorum sayısı ve review durumu"""
+    return {
+        "comments": {key: len(value) for key, value in comments.items() if value},
+        "reviews": {key: value.get("status") for key, value in reviews.items()},
+    }
+
+
+def _patch_indicators(indicators, puts):
+    """Snapshot'taki gösterge özetini günlükteki yorum/review kayıtlarıyla güncelle"""
+    comments = dict(indicators.get("comments", {}))
+    reviews = dict(indicators.get("reviews", {}))
+    for (section, key), value in puts.items():
+        if section == "comments":
+            if value is _DELETED or not value:
+                comments.pop(key, None)
+            else:
+                comments[key] = len(value)
+        elif section == "reviews":
+            if value is _DELETED:
+                reviews.pop(key, None)
+            else:
+                reviews[key] = value.get("status")
+    return {"comments": comments, "reviews": reviews}
+
+
+def assemble_project(items):
+    """(bölüm, anahtar, değer) akışından proje sözlüğü oluştur"""
+    data = {}
+    for section, key, value in items:
+        if key is None:
+            data[section] = value
+        elif section == "history":
+            data.setdefault(section, []).append(value)
+        else:
+            data.setdefault(section, {})[key] = value
+    return data
+
+
+class JsonStreamReader:
+    """Proje JSON dosyasını parça parça okuyan ayrıştırıcı
+
+    Üst seviye objenin anahtarları sırayla okunur. ``STREAM_SECTIONS``
+    içindeki bölümlerin elemanları ``(bölüm, anahtar, değer)`` olarak tek tek
+    üretilir (listelerde anahtar sıra numarasıdır); diğer anahtarlar ve boş
+    bölümler ``(anahtar, None, değer)`` olarak bütün halinde üretilir. Dosya hiçbir
+    zaman tek seferde belleğe çözülmez.
+
+    ``skip_sections`` içindeki bölümler akışta üretilmez, istendiğinde
+    ``lazy`` fonksiyonlarıyla okunur. Dosya sonundaki bölümlerin hepsi
+    atlanıyorsa okuma ``tail_sections`` noktasında durur; daha sonra aynı
+    konumdan devam edilir. Bu işareti taşımayan eski dosyalarda atlanan bölüm
+    bütün halinde çözülüp saklanır.
+    """
+
+    def __init__(self, path, stream_sections=STREAM_SECTIONS, chunk_size=1 << 16, skip_sections=(),
+                 start=0, prefix=""):
+        self.path = path
+        self.stream_sections = stream_sections
+        self.skip_sections = skip_sections
+        self.lazy = {section: functools.partial(self.read_section, section) for section in skip_sections}
+        self.deferred = {}      # atlanan ama okunmuş bölümler
+        self.tail = None        # (ilk bölüm, dosya konumu) - okuma dosya sonundaki bölümlerde durduysa
+        self.done = False
+        self.chunk_size = chunk_size
+        self.start = start
+        self.total = os.path.getsize(path)
+        self.bytes_read = start
+        self.buf = prefix
+        self.pos = 0
+        self.eof = False
+        self._file = None
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+
+    def progress(self):
+        return self.bytes_read / self.total if self.total else 1.0
+
+    def _fill(self, size=None):
+        """Tampona yeni veri oku; dosya bittiyse False döndür"""
+        if self.eof:
+            return False
+        raw = self._file.read(size or self.chunk_size)
+        self.bytes_read += len(raw)
+        if not raw:
+            self.eof = True
+            self.buf = self.buf[self.pos:] + self._utf8.decode(b"", final=True)
+            self.pos = 0
+            return False
+        self.buf = self.buf[self.pos:] + self._utf8.decode(raw)
+        self.pos = 0
+        return True
+
+    def _offset(self):
+        """Tampondaki okuma konumunun dosyadaki bayt karşılığı"""
+        pending = self._utf8.getstate()[0]
+        return self.bytes_read - len(pending) - len(self.buf[self.pos:].encode("utf-8"))
+
+    def _peek(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError(f"{self.path}: '{char}' bekleniyordu (konum {self.bytes_read})")
+        self.pos += 1
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+                # Tamponun sonunda kesilen sayı ("1." / "2e") yarım okunmuş olabilir
+                if (self.eof or not isinstance(value, (int, float))
+                        or (end < len(self.buf) and self.buf[end] in ",]} \t\r\n")):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # Değer tampona sığmadı; okunan miktarı büyüterek tekrar dene
+            self._fill(max(self.chunk_size, len(self.buf) - self.pos))
+
+    def __iter__(self):
+        with open(self.path, "rb") as self._file:
+            self._file.seek(self.start)
+            self._expect("{")
+            if self._peek() == "}":
+                self.done = True
+                return
+            tail = ()
+            while True:
+                section = self._value()
+                self._expect(":")
+                if section in self.skip_sections:
+                    if tail and section == tail[0] and set(tail) <= set(self.skip_sections):
+                        # Dosyanın geri kalanı sadece atlanan bölümler; okumayı burada bırak
+                        self._peek()
+                        self.tail = (section, self._offset())
+                        self.bytes_read = self.total
+                        self.done = True
+                        return
+                    self.deferred[section] = self._value()
+                elif section == "tail_sections":
+                    # Sadece hemen arkasından gelen bölümler için geçerli
+                    tail = self._value()
+                    section = None
+                elif section in self.stream_sections and self._peek() in "{[":
+                    yield from self._members(section)
+                else:
+                    yield section, None, self._value()
+                if section is not None:
+                    tail = ()
+                char = self._peek()
+                self.pos += 1
+                if char == "}":
+                    self.done = True
+                    return
+                if char != ",":
+                    raise ValueError(f"{self.path}: geçersiz JSON (konum {self.bytes_read})")
+
+    def read_section(self, section):
+        """Atlanan bölümü oku; okuma dosya sonunda durduysa kalınan yerden devam edilir"""
+        if section not in self.deferred and not (self.done and self.tail is None):
+            if self.tail is not None:
+                first, offset = self.tail
+                reader = JsonStreamReader(self.path, stream_sections=(), start=offset,
+                                          prefix="{" + json.dumps(first) + ":")
+            else:
+                # Akış bu bölüme henüz gelmedi
+                reader = JsonStreamReader(self.path, stream_sections=())
+            # Yoldaki diğer atlanan bölümler de bir sonraki istek için saklanır
+            for name, _, value in reader:
+                if name in self.skip_sections and name not in self.deferred:
+                    self.deferred[name] = value
+                if name == section:
+                    break
+        return self.deferred.pop(section, None)
+
+    def _members(self, section):
+        opening = self.buf[self.pos]
+        closing = "}" if opening == "{" else "]"
+        self.pos += 1
+        if self._peek() == closing:
+            # Boş bölüm yine de sonuçta yer alsın
+            self.pos += 1
+            yield section, None, {} if opening == "{" else []
+            return
+        index = 0
+        while True:
+            if opening == "{":
+                key = self._value()
+                self._expect(":")
+            else:
+                key = index
+                index += 1
+            yield section, key, self._value()
+            char = self._peek()
+            self.pos += 1
+            if char == closing:
+                return
+            if char != ",":
+                raise ValueError(f"{self.path}: geçersiz JSON (konum {self.bytes_read})")
+
+
+class ProjectStream:
+    """İlerleme bilgisi veren (bölüm, anahtar, değer) akışı
+
+    ``lazy``: akışta yer almayan bölümler için bölüm -> değeri okuyan fonksiyon.
+    ``warnings``: okunamayıp boş kabul edilen bölümler için kullanıcı mesajları.
+    """
+
+    def __init__(self, items, progress=None, lazy=None):
+        self.items = iter(items)
+        self._progress = progress
+        self.lazy = lazy or {}
+        self.warnings = []
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.items)
+
+    def progress(self):
+        return self._progress() if self._progress else 0.0
+
+    @classmethod
+    def from_data(cls, data):
+        """Bellekteki proje sözlüğünü aynı akış biçiminde üret"""
+        total = sum(len(value) if section in STREAM_SECTIONS and value else 1 for section, value in data.items())
+        count = [0]
+
+        def items():
+            for section, value in data.items():
+                if section in STREAM_SECTIONS and value:
+                    members = value.items() if isinstance(value, dict) else enumerate(value)
+                    for key, member in members:
+                        count[0] += 1
+                        yield section, key, member
+                else:
+                    count[0] += 1
+                    yield section, None, value
+
+        return cls(items(), lambda: count[0] / total if total else 1.0)
+
+
+class ProjectJournal:
+    """Snapshot dosyası + sadece sona eklenen değişiklik günlüğü
+
+    Her kayıt tek satırlık bir JSON objesidir ve artan bir ``seq`` numarası
+    taşır. Snapshot kendi ``journal_seq`` değerini sakladığı için, sıkıştırma
+    sırasında yarıda kalan bir günlük tekrar oynatılsa bile eski kayıtlar
+    atlanır.
+
+    Snapshot formatı ``reader(yol, skip_sections=...)`` (``progress()`` ve
+    atlanan bölümler için ``lazy`` okuyucuları olan bir akış döndürür) ve
+    ``writer(yol, veri)`` ile değiştirilebilir; varsayılan JSON'dur.
+    """
+
+    def __init__(self, snapshot_path=PROJECT_FILE, compact_every=5000,
+                 reader=JsonStreamReader, writer=write_json_snapshot):
+        self.snapshot_path = snapshot_path
+        self.journal_path = snapshot_path + JOURNAL_SUFFIX
+        self.compact_every = compact_every
+        self.reader = reader
+        self.writer = writer
+        self.seq = 0
+        self.record_count = 0
+
+    def exists(self):
+        return os.path.exists(self.snapshot_path) or os.path.exists(self.journal_path)
+
+    def needs_compaction(self):
+        return self.record_count >= self.compact_every
+
+    def append(self, records):
+        """Kayıtları günlüğün sonuna ekle"""
+        if not records:
+            return 0
+        lines = []
+        for record in records:
+            self.seq += 1
+            record["seq"] = self.seq
+            lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.record_count += len(records)
+        return len(records)
+
+    def write_snapshot(self, data):
+        """Tam snapshot yaz ve günlüğü sıfırla (sıkıştırma)"""
+        # journal_seq başta yazılır ki akışlı okuma günlüğü hemen birleştirebilsin
+        data = dict({"journal_seq": self.seq}, **data)
+        self.writer(self.snapshot_path, data)
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.record_count = 0
+
+    def _read_records(self):
+        """Günlükteki geçerli kayıtlar; yarım kalan kuyruk dosyadan kesilir"""
+        records = []
+        if not os.path.exists(self.journal_path):
+            return records
+        good_end = 0
+        broken = False
+        with open(self.journal_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    broken = True
+                    break
+                try:
+                    record = json.loads(line.decode("utf-8")) if line.strip() else None
+                except ValueError:
+                    # Çökme sırasında yarım kalmış satır
+                    broken = True
+                    break
+                good_end += len(line)
+                if record is not None:
+                    records.append(record)
+        if broken:
+            # Yeni kayıtlar bozuk satırın arkasına eklenmesin
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(good_end)
+        return records
+
+    def _collect(self, records, base_seq):
+        """Snapshot'tan yeni kayıtları (bölüm, anahtar) bazında birleştir"""
+        puts, appends, meta = {}, [], {}
+        self.seq = base_seq
+        self.record_count = 0
+        for record in records:
+            if record.get("seq", 0) <= base_seq:
+                continue
+            op = record["op"]
+            if op == "put":
+                puts[(record["section"], record["key"])] = record["value"]
+            elif op == "del":
+                puts[(record["section"], record["key"])] = _DELETED
+            elif op == "append":
+                appends.append(record["value"])
+            elif op == "meta":
+                meta.update(meta_values(record["value"]))
+            self.seq = record["seq"]
+            self.record_count += 1
+        return puts, appends, meta
+
+    def _merge(self, snapshot, merged, lazy=()):
+        puts, appends, meta = merged
+        history_count = 0
+        for section, key, value in snapshot:
+            if section == "journal_seq" and key is None:
+                continue
+            if section == "history":
+                history_count += key is not None
+            elif key is not None:
+                override = puts.pop((section, key), _MISSING)
+                if override is _DELETED:
+                    continue
+                if override is not _MISSING:
+                    value = override
+            elif section == "indicators":
+                value = _patch_indicators(value, puts)
+            elif section in meta:
+                # Günlükteki meta değeri snapshot'takini ezer
+                value = meta.pop(section)
+            yield section, key, value
+        for (section, key), value in puts.items():
+            if value is not _DELETED and section not in lazy:
+                yield section, key, value
+        if "history" not in lazy:
+            for entry in appends:
+                yield "history", history_count, entry
+                history_count += 1
+        for key, value in meta.items():
+            yield key, None, value
+
+    def _section_loader(self, section, merged, read=None):
+        """Akışta atlanan bölümü snapshot'tan okuyup günlük kayıtlarıyla birleştiren fonksiyon"""
+        puts, appends, _ = merged
+
+        def load():
+            value = read() if read else None
+            if section == "history":
+                return (value or []) + appends
+            value = value or {}
+            for (put_section, key), put in puts.items():
+                if put_section != section:
+                    continue
+                if put is _DELETED:
+                    value.pop(key, None)
+                else:
+                    value[key] = put
+            return value
+
+        return load
+
+    def stream(self, lazy=()):
+        """Snapshot + günlüğü tek seferde belleğe almadan (bölüm, anahtar, değer) akışı olarak oku
+
+        Günlük kayıtları küçük olduğu için önce okunur; snapshot elemanları
+        okundukça günlükteki son hallerine göre düzeltilir, snapshot'ta
+        olmayan kayıtlar akışın sonunda verilir. ``lazy`` bölümleri akışta
+        yer almaz, istendiğinde ``ProjectStream.lazy`` fonksiyonlarıyla okunur.
+        """
+        records = self._read_records()
+        items, progress, readers, warnings, base_seq = (), None, {}, [], 0
+        if os.path.exists(self.snapshot_path):
+            snapshot = self.reader(self.snapshot_path, skip_sections=lazy)
+            items, progress, readers = iter(snapshot), snapshot.progress, snapshot.lazy
+            warnings = getattr(snapshot, "warnings", warnings)
+            # journal_seq snapshot'ın ilk anahtarıdır
+            first = next(items, None)
+            if first is not None and first[0] == "journal_seq" and first[1] is None:
+                base_seq = first[2]
+            elif first is not None:
+                items = itertools.chain([first], items)
+        merged = self._collect(records, base_seq)
+        loaders = {section: self._section_loader(section, merged, readers.get(section)) for section in lazy}
+        stream = ProjectStream(self._merge(items, merged, lazy), progress, loaders)
+        stream.warnings = warnings
+        return stream
+
+    def load(self):
+        """Snapshot'ı oku, ardından günlük kuyruğunu üzerine oynat"""
+        data = assemble_project(self.stream())
+        history = data.get("history")
+        if history and len(history) > HISTORY_LIMIT:
+            data["history"] = history[-HISTORY_LIMIT:]
+        return data
+
+
+class BackgroundSaver:
+    """Kayıt işlerini sırayla çalıştıran tek worker thread
+
+    İşler ``submit`` ile kuyruğa eklenir ve eklendikleri sırayla çalışır.
+    Sonuçlar ``(etiket, başarılı, değer)`` olarak ``poll`` ile Tk döngüsünden
+    okunur; worker thread hiçbir zaman Tk'ya dokunmaz.
+    """
+
+    def __init__(self):
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.pending = 0
+        self.thread = threading.Thread(target=self._run, name="project-saver", daemon=True)
+        self.thread.start()
+
+    def submit(self, label, func, *args):
+        self.pending += 1
+        self.jobs.put((label, func, args))
+
+    def busy(self):
+        return self.pending > 0
+
+    def wait(self):
+        """Kuyruktaki tüm işler bitene kadar bekle"""
+        self.jobs.join()
+
+    def poll(self):
+        """Biten işlerin sonuçlarını bloklamadan döndür"""
+        results = []
+        while True:
+            try:
+                results.append(self.results.get_nowait())
+            except queue.Empty:
+                return results
+            self.pending -= 1
+
+    def _run(self):
+        while True:
+            label, func, args = self.jobs.get()
+            try:
+                self.results.put((label, True, func(*args)))
+            except Exception as e:
+                self.results.put((label, False, e))
+            finally:
+                self.jobs.task_done()
@@ -0,0 +1,207 @@
+"""Gereksinimler için az bellek kullanan kayıt tipi
+
+Her gereksinim ~15 anahtarlı bir sözlük yerine ``__slots__``'lu bir
+``Requirement`` nesnesinde tutulur. Tekrarlanan kısa metinler (tip, durum,
+katman, renk, oluşturan) kod tablolarında bir kez saklanır ve kayıtta küçük
+tamsayı kodlarıyla tutulur; ISO zaman damgaları mikro saniye cinsinden
+tamsayıya çevrilir.
+
+Kayıt, uygulamanın kullandığı sözlük arayüzünü (``info["status"]``,
+``get``, ``setdefault``, ``items``...) destekler ve değerleri her zaman
+orijinal haliyle döndürür; böylece kayıt/yükleme formatları değişmez.
+"""
+from datetime import datetime, timedelta
+
+
+class Codebook:
+    """Tekrarlanan değerler için değer <-> küçük tamsayı kod tablosu"""
+
+    def __init__(self, values=()):
+        self.values = []
+        self.codes = {}
+        for value in values:
+            self.code(value)
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self.codes[value] = code
+        return code
+
+    def __len__(self):
+        return len(self.values)
+
+
+TYPES = Codebook(["ust", "alt"])
+STATUSES = Codebook(["Draft", "In Review", "Approved", "Rejected", "Implemented"])
+LAYERS = Codebook(["Background", "Groups", "Requirements", "Notes"])
+COLORS = Codebook(["lightgreen", "lightblue"])
+USERS = Codebook(["Kullanıcı", "Unknown"])
+
+# Alan adı -> kod tablosu
+CODEBOOKS = {"type": TYPES, "status": STATUSES, "layer": LAYERS, "color": COLORS, "created_by": USERS}
+
+TIME_FIELDS = ("created_date", "modified_date")
+
+# Alanların kayıt ve dosya sırası, alan adı -> slot
+FIELDS = ("id", "num", "type", "pos", "text", "note", "children", "color", "layer", "status",
+          "created_by", "created_date", "modified_date")
+_SLOTS = {
+    "id": "id", "num": "num", "pos": "x", "text": "text", "note": "note", "children": "children",
+    "type": "_type", "color": "_color", "layer": "_layer", "status": "_status",
+    "created_by": "_created_by", "created_date": "_created", "modified_date": "_modified",
+}
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def encode_time(value):
+    """ISO zaman damgası -> mikro saniye; birebir geri dönmeyen değerler olduğu gibi kalır"""
+    if isinstance(value, str):
+        try:
+            moment = datetime.fromisoformat(value)
+        except ValueError:
+            return value
+        if moment.tzinfo is None and moment.isoformat() == value:
+            return (moment - _EPOCH) // _MICROSECOND
+    return value
+
+
+def decode_time(value):
+    if isinstance(value, int):
+        return (_EPOCH + value * _MICROSECOND).isoformat()
+    return value
+
+
+def _decoder(field):
+    slot = _SLOTS[field]
+    if field == "pos":
+        return lambda r: (r.x, r.y)
+    if field in CODEBOOKS:
+        values = CODEBOOKS[field].values
+        return lambda r: values[getattr(r, slot)]
+    if field in TIME_FIELDS:
+        return lambda r: decode_time(getattr(r, slot))
+    return lambda r: getattr(r, slot)
+
+
+_DECODERS = {field: _decoder(field) for field in FIELDS}
+
+
+class Requirement:
+    """Tek bir gereksinim; sözlük gibi okunup yazılabilir
+
+    Bilinmeyen anahtarlar (eski/yeni sürüm alanları) ``extra`` sözlüğünde
+    tutulur, böylece dosyadaki hiçbir alan kaybolmaz.
+    """
+
+    __slots__ = ("id", "num", "x", "y", "text", "note", "children",
+                 "_type", "_color", "_layer", "_status", "_created_by", "_created", "_modified",
+                 "extra")
+
+    def __init__(self, values=(), **fields):
+        self.extra = None
+        self.update(values, **fields)
+
+    @classmethod
+    def from_dict(cls, info):
+        return cls(info)
+
+    def to_dict(self):
+        return dict(self.items())
+
+    # --- Sözlük arayüzü ---
+    def __getitem__(self, key):
+        decode = _DECODERS.get(key)
+        if decode is None:
+            if self.extra is not None and key in self.extra:
+                return self.extra[key]
+            raise KeyError(key)
+        try:
+            return decode(self)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        slot = _SLOTS.get(key)
+        if slot is None:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+        elif key == "pos":
+            self.x, self.y = value
+        elif key in CODEBOOKS:
+            setattr(self, slot, CODEBOOKS[key].code(value))
+        elif key in TIME_FIELDS:
+            setattr(self, slot, encode_time(value))
+        else:
+            setattr(self, slot, value)
+
+    def __delitem__(self, key):
+        slot = _SLOTS.get(key)
+        if slot is None:
+            if self.extra is None or key not in self.extra:
+                raise KeyError(key)
+            del self.extra[key]
+        elif not hasattr(self, slot):
+            raise KeyError(key)
+        else:
+            delattr(self, slot)
+            if key == "pos":
+                delattr(self, "y")
+
+    def __contains__(self, key):
+        slot = _SLOTS.get(key)
+        if slot is None:
+            return self.extra is not None and key in self.extra
+        return hasattr(self, slot)
+
+    def keys(self):
+        keys = [field for field in FIELDS if hasattr(self, _SLOTS[field])]
+        if self.extra:
+            keys.extend(self.extra)
+        return keys
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, values=(), **fields):
+        if hasattr(values, "keys"):
+            values = [(key, values[key]) for key in values.keys()]
+        for key, value in values:
+            self[key] = value
+        for key, value in fields.items():
+            self[key] = value
+
+    def __eq__(self, other):
+        if isinstance(other, Requirement):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Requirement({self.to_dict()!r})"
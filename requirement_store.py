@@ -0,0 +1,761 @@
+"""Tkinter'dan bağımsız proje modeli
+
+Gereksinimler, bağlantılar, gruplar, text box'lar, katmanlar, yorumlar,
+review'lar ve değişiklik geçmişi burada tutulur. ``RequirementApp`` bu modeli
+çizen ve dialoglardan gelen değişiklikleri buraya ileten bir görünümdür;
+canvas id'leri modelde tutulmaz. Böylece büyük projeler ekran olmadan
+script'lerde işlenebilir::
+
+    journal = ProjectJournal("requirements.json")
+    store = RequirementStore().load(journal.stream())
+    store.bulk_update("requirements", store.requirements_where(status="Draft"), layer="Notes")
+    journal.write_snapshot(store.project_data())
+"""
+from datetime import datetime, timedelta
+
+from project_storage import HISTORY_LIMIT, collaboration_indicators, copy_value, snapshot_project, strip_layer
+from requirement_record import Requirement
+from spatial_index import GridIndex
+from trace_graph import TraceGraph
+
+STATUS_OPTIONS = ["Draft", "In Review", "Approved", "Rejected", "Implemented"]
+
+# Katmanı belirtilmemiş (eski) objelerin varsayılan katmanı
+OBJECT_LAYERS = {"requirements": "Requirements", "groups": "Groups", "text_boxes": "Notes"}
+
+# Katman obje listelerinde kullanılan kısa tür adları
+OBJECT_KINDS = {"requirements": "req", "groups": "group", "text_boxes": "text"}
+
+# Gereksinim kutusunun dünya birimindeki boyutu (grup ve text box'ların kendi boyutu var)
+REQUIREMENT_SIZE = (160, 80)
+
+
+def default_layers():
+    return {
+        "Background": {"visible": True, "locked": False, "color": "lightgray", "objects": {}},
+        "Groups": {"visible": True, "locked": False, "color": "blue", "objects": {}},
+        "Requirements": {"visible": True, "locked": False, "color": "green", "objects": {}},
+        "Notes": {"visible": True, "locked": False, "color": "orange", "objects": {}}
+    }
+
+
+def now():
+    return datetime.now().isoformat()
+
+
+def _lazy_section(name):
+    """Yükleyicisi varsa ilk erişimde okunan bölüm"""
+    attr = "_" + name
+
+    def get(self):
+        if name in self.lazy:
+            self.load_section(name)
+        return getattr(self, attr)
+
+    def set(self, value):
+        self.lazy.pop(name, None)
+        setattr(self, attr, value)
+
+    return property(get, set)
+
+
+class RequirementStore:
+    """Proje verisi ve üzerindeki işlemler
+
+    Değişiklik yapan metodlar objeyi bir sonraki kayıt için işaretler ve
+    geçmişe yazar; ``on_change`` verilmişse her işlemden sonra bir kez çağrılır
+    (uygulama başlığı ve otomatik kayıt için).
+
+    Yorumlar, review'lar ve geçmiş ``defer_sections`` ile ertelenebilir; bu
+    durumda ilk erişimde okunurlar. Canvas göstergeleri o zamana kadar
+    dosyadaki ``indicators`` özetinden cevaplanır.
+
+    Pozisyon ve boyutlar zoom'dan bağımsız dünya birimindedir; zoom sadece
+    görünümün ölçeğidir (``view_zoom``). Objelerin sınırları ``spatial``
+    ızgara indekslerinde tutulur (tıklama, seçim ve görünüm sorguları için);
+    pozisyon ve boyutlar ``place``, ``update`` veya ``move`` ile
+    değiştirilmelidir.
+
+    Katmanların ``objects`` alanı (tür, anahtar) -> None sıralı kümesidir;
+    objeyi ekleyen, silen veya katmanını değiştiren metodlar onu tek adımda
+    günceller.
+
+    Bağlantılar ``graph``'ta ileri ve geri komşuluklarıyla tutulur; ``links``
+    onun kayda yazılan ileri tarafıdır. Gereksinimlerin ``children`` listeleri
+    ``add_child``, ``remove_child`` ve ``delete_requirement`` ile birlikte
+    güncellenir.
+    """
+
+    comments = _lazy_section("comments")   # object_id -> [comment_list]
+    reviews = _lazy_section("reviews")     # object_id -> review_info
+    history = _lazy_section("history")     # Tüm değişiklik geçmişi
+    links = property(lambda self: self.graph.links)  # üst -> [alt]
+
+    def __init__(self, on_change=None):
+        self.on_change = on_change
+        self.layers = default_layers()
+        self.current_layer = "Requirements"
+        self.view_zoom = 1.0
+        self.clear()
+
+    def clear(self):
+        """Objeleri, geçmişi ve sayaçları sıfırla (katmanlar ve zoom korunur)"""
+        self.requirements = {}
+        self.graph = TraceGraph()
+        self.groups = {}
+        self.text_boxes = {}
+        self.spatial = {section: GridIndex() for section in OBJECT_LAYERS}
+        for layer_data in self.layers.values():
+            layer_data["objects"] = {}
+        self.position_scale = 1.0  # okunan dosyadaki pozisyonların ölçeği (eski sürümler zoom'lu yazardı)
+        self.lazy = {}          # ertelenen bölüm -> değeri okuyan fonksiyon
+        self.indicators = {}    # "comments"/"reviews" -> obje başına özet
+        self.comments = {}
+        self.reviews = {}
+        self.history = []
+        self.current_user = "Kullanıcı"
+        self.next_id = 1
+        self.next_group_id = 1
+        self.next_text_id = 1
+        self.id_prefix = "R"
+        self.storage_mode = "json"
+        self.clear_dirty()
+
+    # --- Değişiklik takibi ---
+    def mark_dirty(self, section=None, key=None):
+        """Değişen objeyi bir sonraki günlük kaydı için işaretle"""
+        if section is None:
+            # Tüm objeler değişti - tam snapshot gerekli
+            self.full_save_needed = True
+        elif section == "meta":
+            # Katman/ayar değişiklikleri her kayıtta meta kaydı olarak yazılır
+            self.meta_dirty = True
+        else:
+            self.dirty_keys.add((section, key))
+        self.changed()
+
+    def changed(self):
+        if self.on_change:
+            self.on_change()
+
+    def has_unsaved_changes(self):
+        return bool(self.dirty_keys or self.full_save_needed or self.meta_dirty)
+
+    def clear_dirty(self):
+        self.dirty_keys = set()      # (bölüm, anahtar) çiftleri
+        self.unsaved_history = 0
+        self.full_save_needed = False
+        self.meta_dirty = False
+
+    # --- Geçmiş ---
+    def add_to_history(self, action, object_type, object_id, description, details=None):
+        """Değişiklik geçmişine kayıt ekle"""
+        history_entry = {
+            "timestamp": now(),
+            "user": self.current_user,
+            "action": action,  # CREATE, MODIFY, DELETE, COMMENT, REVIEW
+            "object_type": object_type,  # requirement, group, text
+            "object_id": str(object_id),
+            "description": description,
+            "details": details or {}
+        }
+        # Geçmiş henüz okunmadıysa yeni kayıtlar okunacak olanların sonuna eklenir
+        self._history.append(history_entry)
+        self.unsaved_history += 1
+
+        # Son 1000 kayıt tut
+        if len(self._history) > HISTORY_LIMIT:
+            del self._history[:-HISTORY_LIMIT]
+
+    def set_current_user(self, name):
+        old_user = self.current_user
+        self.current_user = name
+        self.meta_dirty = True
+        self.add_to_history("SYSTEM", "user", "change", f"Kullanıcı değişti: {old_user} → {name}")
+        self.changed()
+
+    # --- Gereksinimler ---
+    def create_requirement(self, rtype, pos=(100, 100), layer=None):
+        num = self.next_id
+        self.next_id += 1
+        rid = f"{self.id_prefix}{num}"
+        created = now()
+
+        self.requirements[num] = Requirement(
+            id=rid,
+            num=num,
+            type=rtype,
+            pos=pos,
+            text=f"Gereksinim {rid}",
+            note="",
+            children=[],
+            color="lightgreen" if rtype == "ust" else "lightblue",
+            layer=layer or self.current_layer,
+            status="Draft",
+            created_by=self.current_user,
+            created_date=created,
+            modified_date=created
+        )
+        self.index_object("requirements", num)
+        self.index_layer("requirements", num)
+        self.dirty_keys.add(("requirements", num))
+        self.add_to_history("CREATE", "requirement", num, f"Gereksinim {rid} oluşturuldu")
+        self.changed()
+        return num
+
+    def set_requirement_text(self, num, text):
+        info = self.requirements[num]
+        old_text = info["text"]
+        if not text or text == old_text:
+            return False
+        info["text"] = text
+        info["modified_date"] = now()
+        self.dirty_keys.add(("requirements", num))
+        self.add_to_history("MODIFY", "requirement", num, f"Başlık değişti: '{old_text}' → '{text}'")
+        self.changed()
+        return True
+
+    def set_note(self, num, note):
+        self.requirements[num]["note"] = note
+        self.mark_dirty("requirements", num)
+
+    def set_status(self, num, status):
+        info = self.requirements[num]
+        old_status = info["status"]
+        if status == old_status:
+            return False
+        info["status"] = status
+        info["modified_date"] = now()
+        self.dirty_keys.add(("requirements", num))
+        self.add_to_history("MODIFY", "requirement", num, f"Durum değiştirildi: {old_status} → {status}")
+        self.changed()
+        return True
+
+    def add_child(self, parent, child):
+        """Alt gereksinimi üst gereksinime bağla; sadece alt → üst bağlanabilir"""
+        info = self.requirements[parent]
+        if self.requirements[child]["type"] != "alt" or info["type"] != "ust":
+            return False
+        if child in info["children"]:
+            return False
+        info["children"].append(child)
+        self.graph.add(parent, child)
+        self.dirty_keys.add(("requirements", parent))
+        self.dirty_keys.add(("links", parent))
+        self.changed()
+        return True
+
+    def remove_child(self, parent, child):
+        """Alt gereksinimin üst gereksinime bağlantısını kaldır (başka üste taşımadan önce)"""
+        if not self.graph.remove(parent, child):
+            return False
+        children = self.requirements[parent]["children"]
+        if child in children:
+            children.remove(child)
+        self.dirty_keys.add(("requirements", parent))
+        self.dirty_keys.add(("links", parent))
+        self.changed()
+        return True
+
+    def parents_of(self, num):
+        """Gereksinimin bağlı olduğu üst gereksinimler"""
+        return self.graph.parents_of(num)
+
+    def link_edges(self, num):
+        """Gereksinime değen (üst, alt) bağlantıları"""
+        return self.graph.edges(num)
+
+    def delete_requirement(self, num):
+        """Gereksinimi bağlantıları, yorumları ve review'ı ile sil
+
+        Alt listesi değişen üst gereksinimlerin numaralarını döndürür.
+        """
+        req_text = self.requirements[num]["text"]
+
+        # Bağlantıları temizle; üstler geri komşuluktan bulunur
+        children, parents = self.graph.remove_node(num)
+        if children is not None:
+            self.dirty_keys.add(("links", num))
+        for pid in parents:
+            self.dirty_keys.add(("links", pid))
+            if pid in self.requirements and num in self.requirements[pid]["children"]:
+                self.requirements[pid]["children"].remove(num)
+                self.dirty_keys.add(("requirements", pid))
+
+        # Yorumları ve review'ları sil
+        object_key = f"req_{num}"
+        for section in ("comments", "reviews"):
+            if getattr(self, section).pop(object_key, None) is not None:
+                self.dirty_keys.add((section, object_key))
+
+        self.add_to_history("DELETE", "requirement", num, f"Gereksinim silindi: {req_text}")
+        self.unindex_layer("requirements", num)
+        del self.requirements[num]
+        self.spatial["requirements"].remove(num)
+        self.dirty_keys.add(("requirements", num))
+        self.changed()
+        return parents
+
+    def reset_ids(self):
+        """Gereksinim ID'lerini mevcut prefix ile baştan numaralandır"""
+        self.next_id = 1
+        for num, info in self.requirements.items():
+            rid = f"{self.id_prefix}{self.next_id}"
+            info["id"] = rid
+            info["text"] = f"Gereksinim {rid}"
+            self.dirty_keys.add(("requirements", num))
+            self.next_id += 1
+        self.changed()
+
+    def set_prefix(self, prefix):
+        self.id_prefix = prefix
+        self.mark_dirty("meta")
+
+    def find_requirement(self, rid):
+        for num, info in self.requirements.items():
+            if info["id"] == rid:
+                return num
+        return None
+
+    def requirements_where(self, status=None, layer=None, created_by=None):
+        """Alanlara göre gereksinim numaraları"""
+        return [num for num, info in self.requirements.items()
+                if (status is None or info.get("status") == status)
+                and (layer is None or info.get("layer") == layer)
+                and (created_by is None or info.get("created_by") == created_by)]
+
+    # --- Gruplar ve text box'lar ---
+    def create_group(self, pos=(200, 150), layer=None):
+        group_id = self.next_group_id
+        self.next_group_id += 1
+        self.groups[group_id] = {
+            "id": group_id,
+            "name": f"Grup {group_id}",
+            "pos": pos,
+            "size": (300, 200),
+            "color": "lightyellow",
+            "layer": layer or self.current_layer
+        }
+        self.index_object("groups", group_id)
+        self.index_layer("groups", group_id)
+        self.mark_dirty("groups", group_id)
+        return group_id
+
+    def create_text_box(self, pos=(100, 300), layer=None):
+        text_id = self.next_text_id
+        self.next_text_id += 1
+        self.text_boxes[text_id] = {
+            "id": text_id,
+            "content": "Yeni Text Box",
+            "pos": pos,
+            "size": (200, 30),
+            "font_size": 10,
+            "layer": layer or self.current_layer
+        }
+        self.index_object("text_boxes", text_id)
+        self.index_layer("text_boxes", text_id)
+        self.mark_dirty("text_boxes", text_id)
+        return text_id
+
+    def delete_object(self, section, key):
+        """Grup veya text box sil (gereksinimler için delete_requirement)"""
+        self.unindex_layer(section, key)
+        del getattr(self, section)[key]
+        self.spatial[section].remove(key)
+        self.mark_dirty(section, key)
+
+    # --- Ortak obje alanları ---
+    def update(self, section, key, **fields):
+        """Objenin alanlarını güncelle (renk, ad, içerik, boyut, katman...)"""
+        if "layer" in fields:
+            self.unindex_layer(section, key)
+        getattr(self, section)[key].update(fields)
+        if "layer" in fields:
+            self.index_layer(section, key)
+        if "pos" in fields or "size" in fields:
+            self.index_object(section, key)
+        self.mark_dirty(section, key)
+
+    def bulk_update(self, section, keys, **fields):
+        """Birden çok objeyi tek işlemde güncelle; geçmişe tek kayıt yazılır"""
+        objects = getattr(self, section)
+        count = 0
+        geometry = "pos" in fields or "size" in fields
+        for key in keys:
+            if "layer" in fields:
+                self.unindex_layer(section, key)
+            objects[key].update(fields)
+            if "layer" in fields:
+                self.index_layer(section, key)
+            if geometry:
+                self.index_object(section, key)
+            self.dirty_keys.add((section, key))
+            count += 1
+        if count:
+            self.add_to_history("MODIFY", section, "bulk", f"{count} obje güncellendi", fields)
+        self.changed()
+        return count
+
+    def move(self, section, key, dx, dy):
+        info = getattr(self, section)[key]
+        self.place(section, key, pos=(info["pos"][0] + dx, info["pos"][1] + dy))
+        self.mark_dirty(section, key)
+
+    def place(self, section, key, pos=None, size=None):
+        """Objeyi taşı/boyutlandır (sürükleme sırasında); kaydı çağıran mark_dirty() ile ister"""
+        info = getattr(self, section)[key]
+        if pos is not None:
+            info["pos"] = pos
+        if size is not None:
+            info["size"] = size
+        self.index_object(section, key)
+
+    # --- Konum sorguları ---
+    def object_bounds(self, section, key):
+        """Objenin sınırları (x0, y0, x1, y1)"""
+        info = getattr(self, section)[key]
+        x, y = info["pos"]
+        w, h = REQUIREMENT_SIZE if section == "requirements" else info["size"]
+        return x, y, x + w, y + h
+
+    def index_object(self, section, key):
+        self.spatial[section].insert(key, *self.object_bounds(section, key))
+
+    def _visible(self, section, keys):
+        objects, default_layer = getattr(self, section), OBJECT_LAYERS[section]
+        return [key for key in keys
+                if self.layers.get(objects[key].get("layer", default_layer), {}).get("visible", True)]
+
+    def objects_at(self, section, x, y):
+        """(x, y) noktasındaki görünür katmanlardaki objeler"""
+        return self._visible(section, self.spatial[section].at_point(x, y))
+
+    def object_at(self, section, x, y):
+        """(x, y) noktasındaki görünür katmandaki ilk obje"""
+        keys = self.objects_at(section, x, y)
+        return keys[0] if keys else None
+
+    def objects_in(self, section, x0, y0, x1, y1, visible_only=True):
+        """Dikdörtgenle kesişen objeler (seçim kutusu, görünüm alanı)"""
+        keys = self.spatial[section].in_rect(x0, y0, x1, y1)
+        return self._visible(section, keys) if visible_only else keys
+
+    # --- Yorumlar ve review'lar ---
+    def add_comment(self, num, content, priority="Normal"):
+        object_key = f"req_{num}"
+        comment_data = {
+            "id": len(self.comments.get(object_key, [])) + 1,
+            "author": self.current_user,
+            "timestamp": now(),
+            "content": content,
+            "priority": priority,
+            "resolved": False
+        }
+        self.comments.setdefault(object_key, []).append(comment_data)
+        self.dirty_keys.add(("comments", object_key))
+        self.add_to_history("COMMENT", "requirement", num, f"Yorum eklendi: {content[:50]}...")
+        self.changed()
+        return comment_data
+
+    def resolve_comment(self, comment):
+        """Yorumu çözüldü olarak işaretle"""
+        comment['resolved'] = True
+        comment['resolved_by'] = self.current_user
+        comment['resolved_date'] = now()
+        for object_key, comment_list in self.comments.items():
+            if any(c is comment for c in comment_list):
+                self.dirty_keys.add(("comments", object_key))
+        self.changed()
+
+    def request_review(self, num, reviewers, notes="", deadline_days=None):
+        object_key = f"req_{num}"
+        deadline_date = None
+        if deadline_days is not None:
+            deadline_date = (datetime.now() + timedelta(days=deadline_days)).isoformat()
+
+        review_data = {
+            "id": len(self.reviews) + 1,
+            "requested_by": self.current_user,
+            "requested_date": now(),
+            "reviewers": reviewers,
+            "notes": notes,
+            "deadline": deadline_date,
+            "status": "pending",
+            "responses": []
+        }
+        self.reviews[object_key] = review_data
+
+        # Status'u "In Review" yap
+        self.requirements[num]["status"] = "In Review"
+        self.requirements[num]["modified_date"] = now()
+        self.dirty_keys.add(("reviews", object_key))
+        self.dirty_keys.add(("requirements", num))
+        self.add_to_history("REVIEW", "requirement", num, f"Review istendi: {', '.join(reviewers)}")
+        self.changed()
+        return review_data
+
+    def approve_review(self, num):
+        return self._close_review(num, "approved", "Approved", "APPROVE", "Review onaylandı")
+
+    def reject_review(self, num, reason):
+        return self._close_review(num, "rejected", "Rejected", "REJECT", f"Review reddedildi: {reason}",
+                                  rejection_reason=reason)
+
+    def _close_review(self, num, review_status, status, action, description, **fields):
+        object_key = f"req_{num}"
+        if object_key not in self.reviews:
+            return False
+        review = self.reviews[object_key]
+        review["status"] = review_status
+        review[f"{review_status}_by"] = self.current_user
+        review[f"{review_status}_date"] = now()
+        review.update(fields)
+
+        # Gereksinim status'unu güncelle
+        self.requirements[num]["status"] = status
+        self.requirements[num]["modified_date"] = now()
+        self.add_to_history(action, "requirement", num, description)
+        self.dirty_keys.add(("reviews", object_key))
+        self.dirty_keys.add(("requirements", num))
+        self.changed()
+        return True
+
+    # --- Ertelenen bölümler ---
+    def defer_sections(self, loaders):
+        """Bölümleri ilk erişime kadar okuma; ``loaders`` bölüm -> değeri döndüren fonksiyon"""
+        self.lazy.update(loaders)
+
+    def load_section(self, name):
+        """Ertelenen bölümü şimdi oku"""
+        value = self.lazy[name]()
+        # Hata olursa bölüm ertelenmiş kalır; eksik veri dosyanın üzerine yazılmaz
+        del self.lazy[name]
+        if name == "history":
+            # Yüklemeden sonra eklenen kayıtlar sonda kalır
+            value = (value or []) + self._history
+            del value[:-HISTORY_LIMIT]
+        setattr(self, name, value if value is not None else {})
+
+    def load_all(self):
+        for name in list(self.lazy):
+            self.load_section(name)
+
+    def comment_count(self, object_key):
+        if "comments" in self.lazy and "comments" in self.indicators:
+            return self.indicators["comments"].get(object_key, 0)
+        return len(self.comments.get(object_key, []))
+
+    def review_status(self, object_key):
+        if "reviews" in self.lazy and "reviews" in self.indicators:
+            return self.indicators["reviews"].get(object_key)
+        review = self.reviews.get(object_key)
+        return review["status"] if review else None
+
+    # --- Katmanlar ---
+    def is_layer_locked(self, layer_name):
+        return self.layers.get(layer_name, {}).get("locked", False)
+
+    def object_layer(self, section, key):
+        return getattr(self, section)[key].get("layer", OBJECT_LAYERS[section])
+
+    def add_layer(self, name):
+        if not name or name in self.layers:
+            return False
+        self.layers[name] = {"visible": True, "locked": False, "color": "black", "objects": {}}
+        # Silinmiş bir katmanın adı tekrar kullanılırsa objeleri geri gelir
+        for section in OBJECT_LAYERS:
+            for key in getattr(self, section):
+                self.index_layer(section, key)
+        self.mark_dirty("meta")
+        return True
+
+    def delete_layer(self, name):
+        if len(self.layers) <= 1 or name not in self.layers:
+            return False
+        del self.layers[name]
+        if self.current_layer == name:
+            self.current_layer = list(self.layers.keys())[0]
+        self.mark_dirty("meta")
+        return True
+
+    def set_current_layer(self, name):
+        self.current_layer = name
+        self.mark_dirty("meta")
+
+    def set_layer_visible(self, name, visible):
+        self.layers[name]["visible"] = visible
+        self.mark_dirty("meta")
+
+    def set_layer_locked(self, name, locked):
+        self.layers[name]["locked"] = locked
+        self.mark_dirty("meta")
+
+    def ensure_layer(self, name):
+        if name not in self.layers:
+            self.layers[name] = {"visible": True, "locked": False, "color": "black", "objects": {}}
+
+    def index_layer(self, section, key):
+        """Objeyi katmanının obje kümesine ekle"""
+        layer_data = self.layers.get(self.object_layer(section, key))
+        if layer_data is not None:
+            layer_data["objects"][(OBJECT_KINDS[section], key)] = None
+
+    def unindex_layer(self, section, key):
+        layer_data = self.layers.get(self.object_layer(section, key))
+        if layer_data is not None:
+            layer_data["objects"].pop((OBJECT_KINDS[section], key), None)
+
+    def update_layer_objects(self):
+        """Katmanların obje kümelerini baştan oluştur (yükleme sonunda)"""
+        for layer_data in self.layers.values():
+            layer_data["objects"] = {}
+        for section in OBJECT_LAYERS:
+            for key in getattr(self, section):
+                self.index_layer(section, key)
+
+    # --- Kayıt ---
+    def project_meta(self):
+        return {
+            "layers": {name: strip_layer(data) for name, data in self.layers.items()},
+            "current_layer": self.current_layer,
+            "current_user": self.current_user,
+            "next_id": self.next_id,
+            "next_group_id": self.next_group_id,
+            "next_text_id": self.next_text_id,
+            "id_prefix": self.id_prefix,
+            # Pozisyonlar dünya birimindedir; eski sürümler bu alanı pozisyonların ölçeği olarak okur
+            "zoom_factor": 1.0,
+            "view_zoom": self.view_zoom,
+            "storage_mode": self.storage_mode
+        }
+
+    def project_data(self):
+        """Kaydedilecek tüm proje verisinin anlık kopyası"""
+        # Akışlı yüklemede katmanlar/zoom ve göstergeler objelerden önce okunsun
+        data = self.project_meta()
+        data.update({
+            "indicators": collaboration_indicators(self.comments, self.reviews),
+            "layers": self.layers,
+            "comments": self.comments,
+            "reviews": self.reviews,
+            "groups": self.groups,
+            "requirements": self.requirements,
+            "links": self.links,
+            "text_boxes": self.text_boxes,
+            "history": self.history
+        })
+        return snapshot_project(data)
+
+    def unsaved_history_entries(self):
+        # Kaydedilmemiş kayıtlar her zaman bellektedir; ertelenen geçmiş okunmaz
+        history = self._history
+        return history[len(history) - min(self.unsaved_history, len(history)):]
+
+    def journal_records(self, all_objects=False):
+        """Son kayıttan beri yapılan değişiklikleri günlük kayıtlarına çevir"""
+        dirty_keys = self.dirty_keys
+        if all_objects:
+            dirty_keys = set(dirty_keys)
+            for section in ("requirements", "groups", "text_boxes", "links"):
+                dirty_keys.update((section, key) for key in getattr(self, section))
+
+        records = []
+        for section, key in dirty_keys:
+            objects = getattr(self, section)
+            if key in objects:
+                records.append({"op": "put", "section": section, "key": str(key),
+                                "value": copy_value(section, objects[key])})
+            else:
+                records.append({"op": "del", "section": section, "key": str(key)})
+
+        # Yeni geçmiş kayıtları
+        for entry in self.unsaved_history_entries():
+            records.append({"op": "append", "section": "history", "value": entry})
+
+        records.append({"op": "meta", "value": self.project_meta()})
+        return records
+
+    # --- Yükleme ---
+    def load_item(self, section, key, value):
+        """Akıştan gelen tek bir öğeyi modele ekle"""
+        if key is None and section in ("requirements", "links", "groups", "text_boxes", "comments", "reviews"):
+            # Boş bölüm
+            return
+
+        if section in OBJECT_LAYERS and self.position_scale != 1.0:
+            self._unscale_loaded(value)
+
+        if section == "requirements":
+            # Eski veriler için eksik alanları güncelle
+            value.setdefault("layer", "Requirements")
+            value.setdefault("status", "Draft")
+            value.setdefault("created_by", "Unknown")
+            value.setdefault("created_date", now())
+            value.setdefault("modified_date", now())
+            # Tekrarlanan metinler kodlanmış, sıkıştırılmış kayıt olarak tutulur
+            self.requirements[int(key)] = Requirement.from_dict(value)
+            self.index_object(section, int(key))
+        elif section in ("groups", "text_boxes"):
+            value.setdefault("layer", OBJECT_LAYERS[section])
+            getattr(self, section)[int(key)] = value
+            self.index_object(section, int(key))
+        elif section == "links":
+            self.graph.set_children(int(key), value)
+        elif section in ("comments", "reviews"):
+            getattr(self, section)[key] = value
+        elif section == "history":
+            if key is None:
+                self.history = value
+            else:
+                self.history.append(value)
+        elif section == "layers":
+            self.layers = value
+            # Obje kümeleri yükleme sonunda kurulur
+            for layer_data in self.layers.values():
+                layer_data["objects"] = {}
+        elif section == "indicators":
+            self.indicators = value
+        elif section == "zoom_factor":
+            # Eski dosyalarda pozisyonlar bu zoom ile kaydedilmiştir; görünüm de aynı ölçekte açılır.
+            # Eski kayıt zoom'u dosyanın sonuna yazar; ondan önce okunmuş objeler burada çevrilir,
+            # sonra gelenler okunurken
+            self.position_scale = self.view_zoom = value
+            if value != 1.0:
+                for obj_section in OBJECT_LAYERS:
+                    for obj_key, info in getattr(self, obj_section).items():
+                        self._unscale_loaded(info)
+                        self.index_object(obj_section, obj_key)
+        elif section in ("current_layer", "current_user", "next_id", "next_group_id", "next_text_id",
+                         "id_prefix", "view_zoom", "storage_mode"):
+            setattr(self, section, value)
+
+    def _unscale_loaded(self, info):
+        """Eski sürümün zoom'lu kaydettiği pozisyon/boyutu dünya birimine çevir"""
+        scale = self.position_scale
+        x, y = info["pos"]
+        info["pos"] = (x / scale, y / scale)
+        if "size" in info:
+            w, h = info["size"]
+            info["size"] = (w / scale, h / scale)
+        # Dosya bir sonraki kayıtta tamamen yeni biçimde yazılsın
+        self.full_save_needed = True
+
+    def finish_load(self):
+        if len(self._history) > HISTORY_LIMIT:
+            del self._history[:-HISTORY_LIMIT]
+        for section, default_layer in OBJECT_LAYERS.items():
+            for info in getattr(self, section).values():
+                self.ensure_layer(info.get("layer", default_layer))
+        self.update_layer_objects()
+
+        # Yükleme geçmişe kaydedilsin
+        self.add_to_history("SYSTEM", "project", "load", "Proje yüklendi")
+
+    def load(self, stream):
+        """Proje akışının tamamını oku (ekransız kullanım için)"""
+        self.clear()
+        self.defer_sections(getattr(stream, "lazy", {}))
+        for section, key, value in stream:
+            self.load_item(section, key, value)
+        self.finish_load()
+        return self
@@ -0,0 +1,130 @@
+"""Objelerin sınırları için düzgün ızgara indeksi
+
+Nokta (tıklama) ve dikdörtgen (seçim, görünüm alanı) sorguları sadece ilgili
+hücrelerdeki objelere bakar; böylece 100 bin objede de milisaniyenin altında
+kalır. Her obje kapladığı hücrelere eklenir, çok büyük objeler ayrı bir
+listede tutulur.
+
+Koordinatlar dünya birimindedir; pan ve zoom sadece görünümü değiştirdiği
+için indeks etkilenmez.
+"""
+import itertools
+import math
+
+CELL_SIZE = 256
+# Bu kadar hücreden fazlasını kaplayan objeler hücrelere dağıtılmaz
+MAX_CELLS = 64
+
+
+class GridIndex:
+    """Anahtar -> dikdörtgen indeksi; sorgular ekleme sırasıyla döner"""
+
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}       # (i, j) -> {anahtar}
+        self.large = set()    # Hücrelere sığmayan objeler
+        self.bounds = {}      # anahtar -> (x0, y0, x1, y1)
+        self.order = {}       # anahtar -> ekleme sırası
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self.bounds)
+
+    def __contains__(self, key):
+        return key in self.bounds
+
+    def _cell_range(self, bounds):
+        size = self.cell_size
+        x0, y0, x1, y1 = bounds
+        return (math.floor(x0 / size), math.floor(y0 / size),
+                math.floor(x1 / size), math.floor(y1 / size))
+
+    def insert(self, key, x0, y0, x1, y1):
+        """Objeyi ekle; zaten varsa yeni sınırlarına taşı"""
+        bounds = (x0, y0, x1, y1)
+        old = self.bounds.get(key)
+        if old is not None:
+            if self._cell_range(old) == self._cell_range(bounds):
+                # Aynı hücrelerde kaldı; sadece sınırlar güncellenir
+                self.bounds[key] = bounds
+                return
+            self._unlink(key, old)
+        else:
+            self.order[key] = next(self._counter)
+        self.bounds[key] = bounds
+        i0, j0, i1, j1 = self._cell_range(bounds)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > MAX_CELLS:
+            self.large.add(key)
+            return
+        cells = self.cells
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                cell = cells.get((i, j))
+                if cell is None:
+                    cells[(i, j)] = {key}
+                else:
+                    cell.add(key)
+
+    def remove(self, key):
+        bounds = self.bounds.pop(key, None)
+        if bounds is not None:
+            self._unlink(key, bounds)
+            del self.order[key]
+
+    def _unlink(self, key, bounds):
+        if key in self.large:
+            self.large.discard(key)
+            return
+        i0, j0, i1, j1 = self._cell_range(bounds)
+        cells = self.cells
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                cell = cells.get((i, j))
+                if cell is not None:
+                    cell.discard(key)
+                    if not cell:
+                        del cells[(i, j)]
+
+    def clear(self):
+        self.cells.clear()
+        self.large.clear()
+        self.bounds.clear()
+        self.order.clear()
+
+    # --- Sorgular ---
+    def _candidates(self, bounds):
+        i0, j0, i1, j1 = self._cell_range(bounds)
+        cells = self.cells
+        found = set(self.large)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(cells):
+            # Geniş sorguda dolu hücreleri gezmek daha ucuz
+            for (i, j), cell in cells.items():
+                if i0 <= i <= i1 and j0 <= j <= j1:
+                    found |= cell
+            return found
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                cell = cells.get((i, j))
+                if cell is not None:
+                    found |= cell
+        return found
+
+    def at_point(self, x, y):
+        """(x, y) noktasını içeren objeler (kenarlar hariç), ekleme sırasıyla"""
+        bounds = self.bounds
+        hits = [key for key in self._candidates((x, y, x, y))
+                if bounds[key][0] < x < bounds[key][2] and bounds[key][1] < y < bounds[key][3]]
+        hits.sort(key=self.order.__getitem__)
+        return hits
+
+    def in_rect(self, x0, y0, x1, y1):
+        """Dikdörtgenle kesişen objeler (kenarlar dahil), ekleme sırasıyla"""
+        rect = (x0, y0, x1, y1)
+        bounds = self.bounds
+        hits = []
+        for key in self._candidates(rect):
+            bx0, by0, bx1, by1 = bounds[key]
+            if not (bx1 < rect[0] or bx0 > rect[2] or by1 < rect[1] or by0 > rect[3]):
+                hits.append(key)
+        hits.sort(key=self.order.__getitem__)
+        return hits
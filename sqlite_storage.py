@@ -0,0 +1,313 @@
+"""SQLite proje formatı: her varlık için ayrı, indeksli tablo
+
+Her satır objenin tamamını ``data`` sütununda JSON olarak tutar; filtrelemede
+kullanılan alanlar (durum, katman, oluşturan, zaman...) ayrıca indeksli
+sütunlara kopyalanır. Böylece dosya formatı JSON ile birebir dönüşebilir,
+paneller de tüm sözlükleri gezmek yerine sorgu yapabilir.
+"""
+import functools
+import json
+import pathlib
+import sqlite3
+
+from project_storage import HISTORY_LIMIT, ProjectStream, apply_record
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS requirements (
+    num INTEGER PRIMARY KEY,
+    status TEXT,
+    layer TEXT,
+    created_by TEXT,
+    modified_date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_requirements_status ON requirements(status);
+CREATE INDEX IF NOT EXISTS idx_requirements_layer ON requirements(layer);
+CREATE INDEX IF NOT EXISTS idx_requirements_created_by ON requirements(created_by);
+
+CREATE TABLE IF NOT EXISTS links (
+    parent INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    child INTEGER NOT NULL,
+    PRIMARY KEY (parent, position)
+);
+CREATE INDEX IF NOT EXISTS idx_links_child ON links(child);
+
+CREATE TABLE IF NOT EXISTS group_boxes (
+    id INTEGER PRIMARY KEY,
+    layer TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_group_boxes_layer ON group_boxes(layer);
+
+CREATE TABLE IF NOT EXISTS text_boxes (
+    id INTEGER PRIMARY KEY,
+    layer TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_text_boxes_layer ON text_boxes(layer);
+
+CREATE TABLE IF NOT EXISTS comments (
+    object_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    author TEXT,
+    timestamp TEXT,
+    resolved INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (object_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_comments_author ON comments(author);
+CREATE INDEX IF NOT EXISTS idx_comments_timestamp ON comments(timestamp);
+
+CREATE TABLE IF NOT EXISTS reviews (
+    object_id TEXT PRIMARY KEY,
+    status TEXT,
+    requested_by TEXT,
+    requested_date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reviews_status ON reviews(status);
+
+CREATE TABLE IF NOT EXISTS history (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT,
+    user TEXT,
+    action TEXT,
+    object_type TEXT,
+    object_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_timestamp ON history(timestamp);
+CREATE INDEX IF NOT EXISTS idx_history_object_id ON history(object_id);
+CREATE INDEX IF NOT EXISTS idx_history_user ON history(user);
+CREATE INDEX IF NOT EXISTS idx_history_action ON history(action);
+
+CREATE TABLE IF NOT EXISTS layers (
+    name TEXT PRIMARY KEY,
+    position INTEGER,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class SqliteProjectStore:
+    """SQLite tabanlı proje dosyası
+
+    Yazmalar arka plandaki kayıt thread'inden ``conn`` ile, sorgular Tk
+    thread'inden salt okunur ``reader`` bağlantısıyla yapılır. WAL modunda
+    okuyucu yazmayı beklemez ve son tamamlanan transaction'ı görür; iki
+    thread aynı bağlantıyı paylaşmadığı için biri diğerinin yarım
+    transaction'ını görmez.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        uri = pathlib.Path(path).absolute().as_uri() + "?mode=ro"
+        self.reader = sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+    def close(self):
+        self.reader.close()
+        self.conn.close()
+
+    # --- Satır yazma ---
+    def _put(self, section, key, value):
+        c = self.conn
+        if section == "requirements":
+            c.execute("INSERT OR REPLACE INTO requirements VALUES (?,?,?,?,?,?)",
+                      (int(key), value.get("status"), value.get("layer"), value.get("created_by"),
+                       value.get("modified_date"), _dumps(value)))
+        elif section == "links":
+            c.execute("DELETE FROM links WHERE parent=?", (int(key),))
+            c.executemany("INSERT INTO links VALUES (?,?,?)",
+                          [(int(key), i, child) for i, child in enumerate(value)])
+        elif section == "groups":
+            c.execute("INSERT OR REPLACE INTO group_boxes VALUES (?,?,?)",
+                      (int(key), value.get("layer"), _dumps(value)))
+        elif section == "text_boxes":
+            c.execute("INSERT OR REPLACE INTO text_boxes VALUES (?,?,?)",
+                      (int(key), value.get("layer"), _dumps(value)))
+        elif section == "comments":
+            c.execute("DELETE FROM comments WHERE object_id=?", (key,))
+            c.executemany("INSERT INTO comments VALUES (?,?,?,?,?,?)",
+                          [(key, i, cm.get("author"), cm.get("timestamp"), int(bool(cm.get("resolved"))), _dumps(cm))
+                           for i, cm in enumerate(value)])
+        elif section == "reviews":
+            c.execute("INSERT OR REPLACE INTO reviews VALUES (?,?,?,?,?)",
+                      (key, value.get("status"), value.get("requested_by"), value.get("requested_date"),
+                       _dumps(value)))
+
+    def _delete(self, section, key):
+        table, column = {
+            "requirements": ("requirements", "num"),
+            "links": ("links", "parent"),
+            "groups": ("group_boxes", "id"),
+            "text_boxes": ("text_boxes", "id"),
+            "comments": ("comments", "object_id"),
+            "reviews": ("reviews", "object_id"),
+        }[section]
+        if column in ("num", "parent", "id"):
+            key = int(key)
+        self.conn.execute(f"DELETE FROM {table} WHERE {column}=?", (key,))
+
+    def _append_history(self, entries):
+        self.conn.executemany(
+            "INSERT INTO history (timestamp, user, action, object_type, object_id, data) VALUES (?,?,?,?,?,?)",
+            [(e.get("timestamp"), e.get("user"), e.get("action"), e.get("object_type"),
+              str(e.get("object_id")), _dumps(e)) for e in entries])
+
+    def _put_meta(self, meta):
+        meta = dict(meta)
+        layers = meta.pop("layers", None)
+        if layers is not None:
+            self.conn.execute("DELETE FROM layers")
+            self.conn.executemany("INSERT INTO layers VALUES (?,?,?)",
+                                  [(name, i, _dumps(dict(layer, objects=[])))
+                                   for i, (name, layer) in enumerate(layers.items())])
+        self.conn.executemany("INSERT OR REPLACE INTO meta VALUES (?,?)",
+                              [(k, _dumps(v)) for k, v in meta.items()])
+
+    def apply_records(self, records):
+        """Günlük kayıtlarını tek transaction'da satır bazında uygula"""
+        with self.conn:
+            history = []
+            for record in records:
+                op = record["op"]
+                if op == "put":
+                    self._put(record["section"], record["key"], record["value"])
+                elif op == "del":
+                    self._delete(record["section"], record["key"])
+                elif op == "append":
+                    history.append(record["value"])
+                elif op == "meta":
+                    self._put_meta(record["value"])
+            if history:
+                self._append_history(history)
+        return len(records)
+
+    def save_project(self, data):
+        """Tüm projeyi sıfırdan yaz (geçmiş dahil)"""
+        with self.conn:
+            for table in ("requirements", "links", "group_boxes", "text_boxes", "comments", "reviews",
+                          "history", "layers", "meta"):
+                self.conn.execute(f"DELETE FROM {table}")
+            for section in ("requirements", "links", "groups", "text_boxes", "comments", "reviews"):
+                for key, value in data.get(section, {}).items():
+                    self._put(section, str(key), value)
+            self._append_history(data.get("history", []))
+            # Göstergeler her yüklemede tablolardan hesaplanır, saklanmaz
+            meta = {k: v for k, v in data.items()
+                    if k not in ("requirements", "links", "groups", "text_boxes", "comments", "reviews", "history",
+                                 "indicators")}
+            self._put_meta(meta)
+
+    # --- Okuma ---
+    def load_section(self, section, up_to=None):
+        """Yorumlar, review'lar veya geçmişi JSON formatındaki haliyle oku
+
+        ``up_to`` verilirse geçmişin sadece o sıra numarasına kadarki
+        kayıtları okunur.
+        """
+        c = self.reader
+        if section == "comments":
+            comments = {}
+            for object_id, d in c.execute("SELECT object_id, data FROM comments ORDER BY object_id, position"):
+                comments.setdefault(object_id, []).append(json.loads(d))
+            return comments
+        if section == "reviews":
+            return {k: json.loads(d) for k, d in c.execute("SELECT object_id, data FROM reviews")}
+        # Bellekte sadece son kayıtlar tutulur; tamamı query_history ile sorgulanabilir
+        if up_to is None:
+            rows = c.execute("SELECT data FROM history ORDER BY seq DESC LIMIT ?", (HISTORY_LIMIT,)).fetchall()
+        else:
+            rows = c.execute("SELECT data FROM history WHERE seq <= ? ORDER BY seq DESC LIMIT ?",
+                             (up_to, HISTORY_LIMIT)).fetchall()
+        return [json.loads(d) for (d,) in reversed(rows)]
+
+    def indicators(self):
+        """Canvas göstergeleri: yorum sayıları ve review durumları (gövdeler çözülmeden)"""
+        c = self.reader
+        return {
+            "comments": dict(c.execute("SELECT object_id, COUNT(*) FROM comments GROUP BY object_id")),
+            "reviews": dict(c.execute("SELECT object_id, status FROM reviews")),
+        }
+
+    def load_project(self, skip_sections=()):
+        """Veritabanını JSON formatıyla aynı yapıda bir sözlüğe oku"""
+        c = self.reader
+        # Meta (katmanlar, zoom) akışta objelerden önce gelsin
+        data = {key: json.loads(value) for key, value in c.execute("SELECT key, value FROM meta")}
+        layers = {name: json.loads(d) for name, d in c.execute("SELECT name, data FROM layers ORDER BY position")}
+        if layers:
+            apply_record(data, {"op": "meta", "value": {"layers": layers}})
+        data.update({
+            "requirements": {str(num): json.loads(d) for num, d in c.execute("SELECT num, data FROM requirements")},
+            "groups": {str(i): json.loads(d) for i, d in c.execute("SELECT id, data FROM group_boxes")},
+            "text_boxes": {str(i): json.loads(d) for i, d in c.execute("SELECT id, data FROM text_boxes")},
+            "links": {},
+        })
+        for parent, child in c.execute("SELECT parent, child FROM links ORDER BY parent, position"):
+            data["links"].setdefault(str(parent), []).append(child)
+        for section in ("comments", "reviews", "history"):
+            if section not in skip_sections:
+                data[section] = self.load_section(section)
+        return data
+
+    def stream(self, lazy=()):
+        """Projeyi akış olarak ver; ``lazy`` bölümleri ilk ihtiyaçta sorgulanır"""
+        data = self.load_project(skip_sections=lazy)
+        if lazy:
+            # Göstergeler objelerden önce okunsun
+            data = dict({"indicators": self.indicators()}, **data)
+        loaders = {section: functools.partial(self.load_section, section) for section in lazy}
+        if "history" in loaders:
+            # Açılıştan sonra eklenen kayıtlar store'da zaten var; geç okunan
+            # geçmiş açılış anındaki kayıtlarla sınırlanır, yoksa iki kez görünür
+            last_seq = self.reader.execute("SELECT COALESCE(MAX(seq), 0) FROM history").fetchone()[0]
+            loaders["history"] = functools.partial(self.load_section, "history", up_to=last_seq)
+        stream = ProjectStream.from_data(data)
+        stream.lazy = loaders
+        return stream
+
+    def query_history(self, action=None, user=None, object_id=None, limit=None):
+        """Filtrelenmiş geçmiş kayıtları (en yeni önce)"""
+        sql = "SELECT data FROM history"
+        conditions, params = [], []
+        for column, value in (("action", action), ("user", user), ("object_id", object_id)):
+            if value is not None:
+                conditions.append(f"{column}=?")
+                params.append(str(value))
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY seq DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(d) for (d,) in self.reader.execute(sql, params)]
+
+    def history_users(self):
+        return [u for (u,) in self.reader.execute("SELECT DISTINCT user FROM history")]
+
+    def requirements_where(self, status=None, layer=None, created_by=None):
+        """İndeksli sütunlara göre gereksinim numaraları"""
+        sql = "SELECT num FROM requirements"
+        conditions, params = [], []
+        for column, value in (("status", status), ("layer", layer), ("created_by", created_by)):
+            if value is not None:
+                conditions.append(f"{column}=?")
+                params.append(value)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        return [num for (num,) in self.reader.execute(sql, params)]
@@ -0,0 +1,86 @@
+"""Gereksinimler arası üst -> alt bağlantı (izlenebilirlik) grafı
+
+İleri komşuluk ``links`` sözlüğüdür (üst -> [alt, ...]); dosyaya eskisi gibi
+bu haliyle yazılır. Geri komşuluk (alt -> üstler) sadece bellekte tutulur,
+böylece bir gereksinimin üstlerini bulmak, onu silmek veya bir bağlantıyı
+kaldırmak tüm bağlantıları taramadan, komşu sayısı kadar sürer.
+"""
+
+
+class TraceGraph:
+    """Üst -> alt kenarları; ileri ve geri komşuluk birlikte güncellenir"""
+
+    def __init__(self):
+        self.links = {}     # üst -> [alt] (kayıt biçimi, ekleme sırasıyla)
+        self.parents = {}   # alt -> {üst: None} (ekleme sırası korunur)
+
+    def __len__(self):
+        return sum(len(children) for children in self.links.values())
+
+    def clear(self):
+        self.links.clear()
+        self.parents.clear()
+
+    def has_edge(self, parent, child):
+        return parent in self.parents.get(child, ())
+
+    def add(self, parent, child):
+        """Kenarı ekle; zaten varsa False"""
+        if self.has_edge(parent, child):
+            return False
+        self.links.setdefault(parent, []).append(child)
+        self.parents.setdefault(child, {})[parent] = None
+        return True
+
+    def remove(self, parent, child):
+        """Kenarı kaldır; yoksa False"""
+        if not self.has_edge(parent, child):
+            return False
+        self.links[parent].remove(child)
+        self._unlink_parent(parent, child)
+        return True
+
+    def set_children(self, parent, children):
+        """Üstün alt listesini verilen listenin kopyasıyla değiştir (yükleme)
+
+        Eski dosyalardaki tekrarlanan bağlantılar tek kenar olarak alınır;
+        kopyalanmazsa okunan değerin sonradan değişmesi iki yönü ayırabilir.
+        """
+        for child in self.links.get(parent, ()):
+            self._unlink_parent(parent, child)
+        children = self.links[parent] = list(dict.fromkeys(children))
+        for child in children:
+            self.parents.setdefault(child, {})[parent] = None
+
+    def remove_node(self, num):
+        """Gereksinime değen tüm kenarları kaldır
+
+        (altları veya gereksinimin ``links`` kaydı yoksa None, üstleri) döndürür.
+        Üstlerin ``links`` kayıtları boşalsa da silinmez.
+        """
+        children = self.links.pop(num, None)
+        for child in children or ():
+            self._unlink_parent(num, child)
+        parents = list(self.parents.pop(num, ()))
+        for parent in parents:
+            self.links[parent].remove(num)
+        return children, parents
+
+    def _unlink_parent(self, parent, child):
+        parents = self.parents.get(child)
+        if parents is not None:
+            parents.pop(parent, None)
+            if not parents:
+                del self.parents[child]
+
+    # --- Sorgular ---
+    def children_of(self, num):
+        return self.links.get(num, [])
+
+    def parents_of(self, num):
+        return list(self.parents.get(num, ()))
+
+    def edges(self, num):
+        """Gereksinime değen (üst, alt) kenarları"""
+        return ([(num, child) for child in self.links.get(num, ())] +
+                [(parent, num) for parent in self.parents.get(num, ())])